@@ -1,17 +1,27 @@
 """API routes for wallet operations."""
 
+from datetime import datetime, timedelta
+from typing import List, Optional
+
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.exceptions import InvalidAddressException, ValidationException
+from app.core.responses import model_response
 from app.db.database import get_db
 from app.schemas.wallet import (
     WalletAddressRequest,
+    WalletHistoryResponse,
     WalletInfoResponse,
     WalletRequestsResponse,
     PaginationParams
 )
+from app.services.export_service import EXPORT_MEDIA_TYPES, get_exporter
 from app.services.tron_service import get_tron_service, TronService
 from app.services.wallet_service import get_wallet_service, WalletService
+from app.services.wallet_watcher import get_wallet_watcher, iter_events
 
 router = APIRouter(prefix="/api/v1/wallet", tags=["wallet"])
 
@@ -21,18 +31,21 @@ async def get_wallet_info(
     request: WalletAddressRequest,
     db: AsyncSession = Depends(get_db),
     tron_service: TronService = Depends(get_tron_service)
-) -> WalletInfoResponse:
+) -> JSONResponse:
     """Get wallet information including balance, bandwidth, and energy.
     
     This endpoint retrieves information about a TRON wallet address including:
     - TRX balance
     - Available bandwidth
     - Available energy
+    - Balances of the requested TRC-20 tokens, if any
     
     Each request is logged to the database for audit purposes.
     """
     wallet_service = get_wallet_service(tron_service)
-    return await wallet_service.get_wallet_info_and_save(request.address, db)
+    return model_response(
+        await wallet_service.get_wallet_info_and_save(request.address, db, request.tokens)
+    )
 
 
 @router.get("/requests", response_model=WalletRequestsResponse)
@@ -41,11 +54,83 @@ async def get_wallet_requests(
     page_size: int = Query(10, ge=1, le=100, description="Page size"),
     db: AsyncSession = Depends(get_db),
     tron_service: TronService = Depends(get_tron_service)
-) -> WalletRequestsResponse:
+) -> JSONResponse:
     """Get paginated list of wallet requests.
     
     This endpoint returns a paginated list of all wallet information requests
     that have been made to the service, including successful and failed requests.
     """
     wallet_service = get_wallet_service(tron_service)
-    return await wallet_service.get_wallet_requests(db, page, page_size)
+    return model_response(await wallet_service.get_wallet_requests(db, page, page_size))
+
+
+@router.get("/requests/export", response_class=StreamingResponse)
+async def export_wallet_requests(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|parquet)$", description="Export format"),
+    address: Optional[str] = Query(None, description="Only export requests for this address"),
+    start: Optional[datetime] = Query(None, description="Only export requests made at or after this time (UTC)"),
+    end: Optional[datetime] = Query(None, description="Only export requests made before this time (UTC)"),
+    db: AsyncSession = Depends(get_db),
+    tron_service: TronService = Depends(get_tron_service)
+) -> StreamingResponse:
+    """Export wallet requests as CSV or Parquet.
+    
+    The audit log is streamed through a server-side cursor with chunked
+    transfer encoding, so arbitrarily large exports use constant memory.
+    """
+    exporter = get_exporter(export_format)
+    wallet_service = get_wallet_service(tron_service)
+    batches = wallet_service.stream_wallet_requests(db, address=address, start=start, end=end)
+    return StreamingResponse(
+        exporter(batches),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="wallet_requests.{export_format}"'}
+    )
+
+
+@router.get("/subscribe", response_class=StreamingResponse)
+async def subscribe_wallets(
+    addresses: List[str] = Query(..., alias="address", description="TRON wallet addresses to watch"),
+    tron_service: TronService = Depends(get_tron_service)
+) -> StreamingResponse:
+    """Subscribe to live wallet updates as server-sent events.
+    
+    The first event for every address carries its full state, later events
+    only the fields that changed. All subscribers share a single poller that
+    fetches each watched address once per interval.
+    """
+    addresses = list(dict.fromkeys(addresses))
+    if len(addresses) > settings.watch_max_addresses:
+        raise ValidationException(
+            f"At most {settings.watch_max_addresses} addresses can be watched per connection"
+        )
+    for address in addresses:
+        if not await tron_service.validate_address(address):
+            raise InvalidAddressException(f"Invalid TRON address: {address}")
+    
+    return StreamingResponse(
+        iter_events(get_wallet_watcher(tron_service), addresses),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
+@router.get("/{address}/history", response_model=WalletHistoryResponse)
+async def get_wallet_history(
+    address: str,
+    start: Optional[datetime] = Query(None, description="Range start (UTC), defaults to 30 days before end"),
+    end: Optional[datetime] = Query(None, description="Range end (UTC), defaults to now"),
+    resolution: int = Query(3600, ge=60, le=31_536_000, description="Bucket width in seconds"),
+    db: AsyncSession = Depends(get_db),
+    tron_service: TronService = Depends(get_tron_service)
+) -> JSONResponse:
+    """Get downsampled history of a wallet.
+    
+    This endpoint aggregates all successful requests recorded for the address
+    into time buckets and returns min/max/avg/last of balance, bandwidth and
+    energy for every bucket that has data.
+    """
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=30)
+    wallet_service = get_wallet_service(tron_service)
+    return model_response(await wallet_service.get_wallet_history(db, address, start, end, resolution))
@@ -0,0 +1,208 @@
+"""Admission control with priority lanes and load shedding."""
+
+import asyncio
+import logging
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from fastapi import status
+
+from app.core.config import settings
+from app.core.deadline import get_remaining
+from app.core.exception_handlers import create_error_response
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HEADER = b"x-priority"
+
+
+@dataclass(frozen=True)
+class PriorityClass:
+    """Concurrency budget and queueing limits of one priority class."""
+
+    name: str
+    rank: int  # lower is more important
+    max_concurrency: int
+    max_queue: int
+    queue_timeout: float
+
+
+def get_priority_classes() -> List[PriorityClass]:
+    """Build priority classes from configuration, most important first."""
+    return [
+        PriorityClass(
+            name="interactive",
+            rank=0,
+            max_concurrency=settings.admission_interactive_concurrency,
+            max_queue=settings.admission_interactive_queue,
+            queue_timeout=settings.admission_interactive_queue_timeout_seconds
+        ),
+        PriorityClass(
+            name="listing",
+            rank=1,
+            max_concurrency=settings.admission_listing_concurrency,
+            max_queue=settings.admission_listing_queue,
+            queue_timeout=settings.admission_listing_queue_timeout_seconds
+        ),
+        PriorityClass(
+            name="batch",
+            rank=2,
+            max_concurrency=settings.admission_batch_concurrency,
+            max_queue=settings.admission_batch_queue,
+            queue_timeout=settings.admission_batch_queue_timeout_seconds
+        ),
+    ]
+
+
+def check_database_budget(priority_classes: List[PriorityClass]) -> bool:
+    """Check that less important classes leave pooled connections for the most important one.
+
+    Listing and batch requests hold a database connection for their whole
+    query or export stream; if together they can take the entire pool,
+    interactive audit writes wait on pool checkout despite their own lane.
+    """
+    if settings.database_url.startswith("sqlite"):
+        return True
+    capacity = settings.database_pool_size + settings.database_max_overflow
+    most_important = min(priority_class.rank for priority_class in priority_classes)
+    others = sum(
+        priority_class.max_concurrency
+        for priority_class in priority_classes
+        if priority_class.rank > most_important
+    )
+    if others >= capacity:
+        logger.warning(
+            f"Lower priority admission budgets ({others}) can hold all {capacity} database "
+            f"connections; raise DATABASE_POOL_SIZE/DATABASE_MAX_OVERFLOW or lower them"
+        )
+        return False
+    return True
+
+
+# Default class of each route; other routes (health, docs, subscriptions) are not managed
+ROUTE_PRIORITIES: List[Tuple[Pattern, str]] = [
+    (re.compile(r"^/api/v1/wallet/info$"), "interactive"),
+    (re.compile(r"^/api/v1/wallet/requests/export$"), "batch"),
+    (re.compile(r"^/api/v1/wallet/requests$"), "listing"),
+    (re.compile(r"^/api/v1/wallet/[^/]+/history$"), "listing"),
+]
+
+
+class _Lane:
+    """Runtime state of a priority class."""
+
+    def __init__(self, priority_class: PriorityClass):
+        """Initialize lane with an empty queue."""
+        self.priority_class = priority_class
+        self.semaphore = asyncio.Semaphore(priority_class.max_concurrency)
+        self.waiting = 0
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware admitting requests per priority class.
+
+    Every managed request is assigned a class by its route. The
+    ``X-Priority`` header may move a request to a less important class,
+    never to a more important one. Each class runs at most
+    ``max_concurrency`` requests; others wait in a queue of ``max_queue``
+    for at most ``queue_timeout`` seconds (or the request deadline). Requests
+    that find the queue full get 429, requests that time out in the queue
+    get 503, both with a ``Retry-After`` header.
+    """
+
+    def __init__(self, app, priority_classes: Optional[List[PriorityClass]] = None):
+        """Initialize middleware wrapping ``app``."""
+        self.app = app
+        if priority_classes is None:
+            priority_classes = get_priority_classes()
+            check_database_budget(priority_classes)
+        self._lanes: Dict[str, _Lane] = {
+            priority_class.name: _Lane(priority_class)
+            for priority_class in priority_classes
+        }
+
+    async def __call__(self, scope, receive, send):
+        """Handle ASGI call."""
+        lane = self._lane_for(scope) if scope["type"] == "http" else None
+        if lane is None:
+            await self.app(scope, receive, send)
+            return
+
+        priority_class = lane.priority_class
+        if lane.semaphore.locked():
+            if lane.waiting >= priority_class.max_queue:
+                await self._shed(scope, receive, send, priority_class, status.HTTP_429_TOO_MANY_REQUESTS)
+                return
+
+            timeout = priority_class.queue_timeout
+            remaining = get_remaining()
+            if remaining is not None:
+                timeout = max(min(timeout, remaining), 0)
+
+            lane.waiting += 1
+            try:
+                admitted = await self._acquire(lane, timeout)
+            finally:
+                lane.waiting -= 1
+            if not admitted:
+                await self._shed(scope, receive, send, priority_class, status.HTTP_503_SERVICE_UNAVAILABLE)
+                return
+        else:
+            await lane.semaphore.acquire()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            lane.semaphore.release()
+
+    async def _acquire(self, lane: _Lane, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a slot in the lane."""
+        acquire = asyncio.ensure_future(lane.semaphore.acquire())
+        try:
+            await asyncio.wait({acquire}, timeout=timeout)
+        except asyncio.CancelledError:
+            self._abandon(lane, acquire)
+            raise
+        if acquire.done():
+            return True
+        self._abandon(lane, acquire)
+        return False
+
+    @staticmethod
+    def _abandon(lane: _Lane, acquire: asyncio.Future) -> None:
+        """Give up a pending slot, releasing it if it was granted meanwhile."""
+        if acquire.done() and not acquire.cancelled():
+            lane.semaphore.release()
+        else:
+            acquire.cancel()
+
+    def _lane_for(self, scope) -> Optional[_Lane]:
+        """Find the lane of a request from its route and priority header."""
+        path = scope["path"]
+        lane = next(
+            (self._lanes.get(name) for pattern, name in ROUTE_PRIORITIES if pattern.match(path)),
+            None
+        )
+        if lane is None:
+            return None
+
+        for name, value in scope.get("headers", []):
+            if name == PRIORITY_HEADER:
+                requested = self._lanes.get(value.decode("latin-1").strip().lower())
+                if requested is not None and requested.priority_class.rank > lane.priority_class.rank:
+                    lane = requested
+                break
+        return lane
+
+    async def _shed(self, scope, receive, send, priority_class: PriorityClass, status_code: int):
+        """Reject a request that could not be admitted."""
+        response = create_error_response(
+            status_code=status_code,
+            error_type="OVERLOADED",
+            message=f"Service is overloaded, {priority_class.name} requests are being shed",
+            details={"priority": priority_class.name}
+        )
+        response.headers["Retry-After"] = str(max(1, math.ceil(priority_class.queue_timeout)))
+        await response(scope, receive, send)
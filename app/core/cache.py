@@ -0,0 +1,170 @@
+"""Cache backends shared by the service layer."""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Base class for key/value cache backends storing bytes with a TTL."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get cached value, or None when missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store value for ``ttl`` seconds."""
+
+
+class NullCacheBackend(CacheBackend):
+    """Cache backend that never stores anything."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Always miss."""
+        return None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Discard value."""
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Bounded in-process cache, private to a single worker."""
+
+    def __init__(self, max_entries: int):
+        """Initialize cache holding at most ``max_entries`` values."""
+        self._max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, bytes]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get cached value, or None when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store value, evicting the oldest entry when full."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+
+class SharedMemoryCacheBackend(CacheBackend):
+    """Cache shared by all worker processes on a host.
+
+    Entries live in an SQLite database in WAL mode, placed on a tmpfs such
+    as ``/dev/shm`` so that it is memory-backed and memory-mapped by every
+    worker. Each worker keeps its own connection; SQLite handles the
+    cross-process locking. The cache is best effort: SQLite errors such as a
+    locked database or a full tmpfs are logged and treated as a miss.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        """Initialize cache stored at ``path`` holding about ``max_entries`` values."""
+        self._path = path
+        self._max_entries = max_entries
+        self._writes = 0
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_expires_at ON cache (expires_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=1.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+        return conn
+
+    def _get(self, key: str) -> Optional[bytes]:
+        """Read value in the executor thread."""
+        row = self._connect().execute(
+            "SELECT value FROM cache WHERE key = ? AND expires_at >= ?",
+            (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, value: bytes, ttl: float) -> None:
+        """Write value in the executor thread, pruning when over capacity."""
+        conn = self._connect()
+        now = time.time()
+        # Counted before inserting, so pruning still runs while inserts fail on a full tmpfs
+        self._writes += 1
+        if self._writes % 1000 == 0:
+            self._prune(conn, now)
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, now + ttl)
+        )
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the soonest to expire when still full."""
+        conn.execute("DELETE FROM cache WHERE expires_at < ?", (now,))
+        excess = conn.execute("SELECT count(*) FROM cache").fetchone()[0] - self._max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY expires_at LIMIT ?)",
+                (excess,)
+            )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get cached value, or None when missing or expired."""
+        loop = asyncio.get_event_loop()
+        try:
+            return await loop.run_in_executor(None, self._get, key)
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache read failed: {str(e)}")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store value for ``ttl`` seconds."""
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, self._set, key, value, ttl)
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache write failed: {str(e)}")
+
+
+def create_cache_backend() -> CacheBackend:
+    """Create cache backend based on configuration."""
+    if settings.cache_backend == "memory":
+        return MemoryCacheBackend(settings.cache_max_entries)
+    if settings.cache_backend == "shared":
+        return SharedMemoryCacheBackend(settings.cache_path, settings.cache_max_entries)
+    if settings.cache_backend == "none":
+        return NullCacheBackend()
+    raise ValueError(f"Unsupported cache backend: {settings.cache_backend}")
+
+
+_cache_backend: Optional[CacheBackend] = None
+
+
+def get_cache_backend() -> CacheBackend:
+    """Get the process-wide cache backend."""
+    global _cache_backend
+    if _cache_backend is None:
+        _cache_backend = create_cache_backend()
+    return _cache_backend
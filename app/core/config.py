@@ -15,7 +15,50 @@ class Settings(BaseSettings):
     app_name: str = "TRON Wallet Service"
     debug: bool = False
     database_url: str = "sqlite:///./data/tron_wallet.db"
+    database_pool_size: int = 5  # not used for SQLite, whose connections are not pooled
+    database_max_overflow: int = 10
     tron_network: str = "mainnet"  # mainnet, shasta, nile
+    tron_timeout_seconds: float = 10.0
+    history_max_points: int = 10000
+    fast_json: bool = True
+    create_schema_on_startup: bool = True  # disable when migrations manage the schema
+    
+    # Request deadlines, overridable per request with the X-Request-Timeout header
+    request_timeout_seconds: float = 10.0
+    request_timeout_max_seconds: float = 60.0
+    
+    # Admission control: concurrency budget, queue length and queue time per priority class.
+    # Listing and batch requests hold a database connection for their whole query or
+    # export, so together they must stay below DATABASE_POOL_SIZE + DATABASE_MAX_OVERFLOW.
+    admission_control_enabled: bool = True
+    admission_interactive_concurrency: int = 64
+    admission_interactive_queue: int = 256
+    admission_interactive_queue_timeout_seconds: float = 2.0
+    admission_listing_concurrency: int = 8
+    admission_listing_queue: int = 32
+    admission_listing_queue_timeout_seconds: float = 1.0
+    admission_batch_concurrency: int = 2
+    admission_batch_queue: int = 4
+    admission_batch_queue_timeout_seconds: float = 0.5
+    
+    # Server
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 1  # 0 means one worker per CPU core
+    
+    # Cache: memory (per worker), shared (all workers on the host), none
+    cache_backend: str = "memory"
+    cache_ttl_seconds: float = 10.0
+    cache_max_entries: int = 100_000
+    cache_path: str = "/dev/shm/tron_wallet_cache.db"
+    negative_cache_ttl_seconds: float = 30.0
+    negative_cache_max_entries: int = 100_000
+    token_contract_cache_max_entries: int = 1_000
+    
+    # Live wallet subscriptions
+    watch_interval_seconds: float = 5.0
+    watch_max_addresses: int = 50  # per connection
+    watch_max_concurrency: int = 16
 
 
 def get_settings() -> Settings:
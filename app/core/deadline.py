@@ -0,0 +1,135 @@
+"""Request-scoped deadlines and cancellation on client disconnect."""
+
+import asyncio
+import time
+from contextlib import suppress
+from contextvars import ContextVar
+from typing import Awaitable, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.exceptions import DeadlineExceededException
+
+T = TypeVar("T")
+
+DEADLINE_HEADER = b"x-request-timeout"
+
+# Monotonic time by which the current request must be finished
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+def get_remaining() -> Optional[float]:
+    """Get seconds left until the current deadline, None when there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def clear_deadline() -> None:
+    """Remove the deadline from the current context, e.g. in background tasks."""
+    _deadline.set(None)
+
+
+def check_deadline() -> None:
+    """Raise if the current deadline has passed."""
+    remaining = get_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededException("Request deadline exceeded")
+
+
+async def with_deadline(awaitable: Awaitable[T]) -> T:
+    """Await ``awaitable``, cancelling it when the current deadline passes."""
+    remaining = get_remaining()
+    if remaining is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, max(remaining, 0))
+    except asyncio.TimeoutError:
+        raise DeadlineExceededException("Request deadline exceeded")
+
+
+def _request_timeout(scope) -> float:
+    """Get the timeout requested by the client, bounded by configuration."""
+    for name, value in scope.get("headers", []):
+        if name == DEADLINE_HEADER:
+            try:
+                timeout = float(value)
+            except ValueError:
+                break
+            if timeout > 0:
+                return min(timeout, settings.request_timeout_max_seconds)
+            break
+    return settings.request_timeout_seconds
+
+
+class DeadlineMiddleware:
+    """ASGI middleware giving every HTTP request a deadline.
+
+    The deadline comes from the ``X-Request-Timeout`` header (seconds) or
+    ``REQUEST_TIMEOUT_SECONDS``. Independently of the deadline, a request is
+    cancelled as soon as its client disconnects, so no more work is spent on
+    a response nobody will read. Once the response has been sent, a
+    disconnect only ends the exchange: post-response work such as dependency
+    teardown and background tasks still runs to completion.
+    """
+
+    def __init__(self, app):
+        """Initialize middleware wrapping ``app``."""
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        """Handle ASGI call."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _deadline.set(time.monotonic() + _request_timeout(scope))
+        try:
+            await self._run_until_disconnect(scope, receive, send)
+        finally:
+            _deadline.reset(token)
+
+    async def _run_until_disconnect(self, scope, receive, send):
+        """Run the application, cancelling it when the client disconnects."""
+        messages: asyncio.Queue = asyncio.Queue()
+        disconnected = asyncio.Event()
+        response_complete = False
+
+        async def pump():
+            # Only this task reads from the server, the application reads the queue
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    if not response_complete:
+                        disconnected.set()
+                    return
+
+        async def queued_receive():
+            return await messages.get()
+
+        async def tracked_send(message):
+            nonlocal response_complete
+            # Flagged before sending, as servers report the disconnect as soon as the body is out
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        app_task = asyncio.create_task(self.app(scope, queued_receive, tracked_send))
+        pump_task = asyncio.create_task(pump())
+        disconnect_task = asyncio.create_task(disconnected.wait())
+        try:
+            await asyncio.wait({app_task, disconnect_task}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            app_task.cancel()
+            raise
+        finally:
+            pump_task.cancel()
+            disconnect_task.cancel()
+
+        if not app_task.done():
+            app_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await app_task
+            return
+        app_task.result()
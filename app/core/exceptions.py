@@ -18,6 +18,11 @@ class InvalidAddressException(AppException):
     pass
 
 
+class InvalidTokenException(AppException):
+    """Exception raised when a TRC-20 contract address is invalid or unknown."""
+    pass
+
+
 class TronNetworkException(AppException):
     """Exception raised when TRON network request fails."""
     pass
@@ -38,13 +43,20 @@ class ValidationException(AppException):
     pass
 
 
+class DeadlineExceededException(AppException):
+    """Exception raised when the request deadline passes before work is done."""
+    pass
+
+
 
 EXCEPTION_STATUS_CODE_MAP = {
     "InvalidAddressException": status.HTTP_400_BAD_REQUEST,
+    "InvalidTokenException": status.HTTP_400_BAD_REQUEST,
     "TronNetworkException": status.HTTP_502_BAD_GATEWAY,
     "DatabaseException": status.HTTP_500_INTERNAL_SERVER_ERROR,
     "WalletNotFoundException": status.HTTP_404_NOT_FOUND,
     "ValidationException": status.HTTP_422_UNPROCESSABLE_ENTITY,
+    "DeadlineExceededException": status.HTTP_504_GATEWAY_TIMEOUT,
     "AppException": status.HTTP_500_INTERNAL_SERVER_ERROR,
 }
 
@@ -0,0 +1,45 @@
+"""Response classes for fast JSON serialization."""
+
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response that serializes Pydantic models directly.
+    
+    Models are rendered with ``model_dump_json`` (pydantic-core), skipping
+    FastAPI's re-validation and ``jsonable_encoder`` pass. Any other content
+    is rendered with orjson when it is installed.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """Render response content to JSON bytes."""
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(content)
+
+
+def get_default_response_class() -> type:
+    """Get the application-wide default response class."""
+    if settings.fast_json:
+        return ModelJSONResponse
+    return JSONResponse
+
+
+def model_response(model: BaseModel) -> JSONResponse:
+    """Build an endpoint response for ``model`` with the configured JSON encoder."""
+    if settings.fast_json:
+        return ModelJSONResponse(model)
+    return JSONResponse(jsonable_encoder(model))
@@ -1,5 +1,6 @@
 """Async database connection and session management."""
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from typing import AsyncGenerator
 
@@ -17,11 +18,22 @@ def get_async_database_url(url: str) -> str:
     return url
 
 
+def get_pool_options(url: str) -> dict:
+    """Get connection pool options, SQLite connections are not pooled."""
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     get_async_database_url(settings.database_url),
     echo=False,
-    future=True
+    future=True,
+    **get_pool_options(settings.database_url)
 )
 
 # Create async session factory
@@ -38,6 +50,16 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def check_db() -> bool:
+    """Check that the database accepts connections."""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get async database session dependency."""
     async with AsyncSessionLocal() as session:
@@ -1,38 +1,54 @@
 """Main FastAPI application module."""
 
-from fastapi import FastAPI
+import asyncio
+
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
 
 from app.api.wallet import router as wallet_router
+from app.core.admission import AdmissionControlMiddleware
 from app.core.config import settings
+from app.core.deadline import DeadlineMiddleware
 from app.core.exceptions import AppException
+from app.core.responses import get_default_response_class
 from app.core.exception_handlers import (
     app_exception_handler,
     validation_exception_handler,
     http_exception_handler,
     general_exception_handler
 )
-from app.db.database import init_db
+from app.db.database import check_db, init_db
+from app.services.tron_service import is_tron_service_ready, warm_up_tron_service
+from app.services.wallet_watcher import shutdown_wallet_watcher
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    await init_db()
+    if settings.create_schema_on_startup:
+        await init_db()
+    warm_up = asyncio.create_task(warm_up_tron_service())
     yield
-    pass
+    warm_up.cancel()
+    await shutdown_wallet_watcher()
 
 
 app = FastAPI(
     title=settings.app_name,
     description="A microservice for retrieving TRON wallet information including balance, bandwidth, and energy",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=get_default_response_class()
 )
 
+# Add admission control with priority lanes
+if settings.admission_control_enabled:
+    app.add_middleware(AdmissionControlMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -42,6 +58,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Add request deadlines and cancellation on client disconnect
+app.add_middleware(DeadlineMiddleware)
+
 # Add exception handlers
 app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
@@ -69,3 +88,23 @@ async def health_check():
         "service": settings.app_name,
         "network": settings.tron_network
     }
+
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness endpoint, healthy as long as the process serves requests."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness endpoint, healthy once the TRON client and database are usable."""
+    checks = {
+        "tron_client": is_tron_service_ready(),
+        "database": await check_db()
+    }
+    ready = all(checks.values())
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "ready" if ready else "not_ready", "checks": checks}
+    )
@@ -1,6 +1,7 @@
 """Pydantic schemas for wallet-related API operations."""
 
 from datetime import datetime
+from decimal import Decimal
 from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -10,6 +11,11 @@ class WalletAddressRequest(BaseModel):
     """Schema for wallet address request."""
     
     address: str = Field(..., description="TRON wallet address")
+    tokens: Optional[List[str]] = Field(
+        None,
+        max_length=20,
+        description="TRC-20 contract addresses to include token balances for"
+    )
     
     @field_validator('address')
     @classmethod
@@ -20,6 +26,16 @@ class WalletAddressRequest(BaseModel):
         return v
 
 
+class TokenBalance(BaseModel):
+    """Schema for TRC-20 token balance."""
+    
+    contract_address: str = Field(..., description="TRC-20 contract address")
+    symbol: str = Field(..., description="Token symbol")
+    decimals: int = Field(..., description="Token decimals")
+    raw_balance: int = Field(..., description="Token balance in the smallest token unit")
+    balance: Decimal = Field(..., description="Exact token balance in token units, serialized as a string")
+
+
 class WalletInfoResponse(BaseModel):
     """Schema for wallet information response."""
     
@@ -29,6 +45,8 @@ class WalletInfoResponse(BaseModel):
     balance: Optional[float] = Field(None, description="TRX balance in TRX units")
     bandwidth: Optional[float] = Field(None, description="Available bandwidth")
     energy: Optional[float] = Field(None, description="Available energy")
+    tokens: Optional[List[TokenBalance]] = Field(None, description="Requested TRC-20 token balances")
+    activated: bool = Field(True, description="Whether the account exists on-chain")
 
 
 class WalletRequestRecord(BaseModel):
@@ -55,6 +73,35 @@ class WalletRequestsResponse(BaseModel):
     total_pages: int = Field(..., description="Total number of pages")
 
 
+class MetricStats(BaseModel):
+    """Schema for aggregated values of a single metric within a time bucket."""
+    
+    min: Optional[float] = Field(None, description="Minimum value in the bucket")
+    max: Optional[float] = Field(None, description="Maximum value in the bucket")
+    avg: Optional[float] = Field(None, description="Average value in the bucket")
+    last: Optional[float] = Field(None, description="Most recent value in the bucket")
+
+
+class WalletHistoryPoint(BaseModel):
+    """Schema for a single downsampled point of wallet history."""
+    
+    bucket_start: datetime = Field(..., description="Start of the time bucket (UTC)")
+    samples: int = Field(..., description="Number of recorded requests in the bucket")
+    balance: MetricStats = Field(..., description="TRX balance statistics")
+    bandwidth: MetricStats = Field(..., description="Available bandwidth statistics")
+    energy: MetricStats = Field(..., description="Available energy statistics")
+
+
+class WalletHistoryResponse(BaseModel):
+    """Schema for downsampled wallet history response."""
+    
+    address: str = Field(..., description="TRON wallet address")
+    start: datetime = Field(..., description="Start of the requested range (UTC)")
+    end: datetime = Field(..., description="End of the requested range (UTC)")
+    resolution: int = Field(..., description="Bucket width in seconds")
+    points: List[WalletHistoryPoint] = Field(..., description="Downsampled history points")
+
+
 class PaginationParams(BaseModel):
     """Schema for pagination parameters."""
     
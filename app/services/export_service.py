@@ -0,0 +1,107 @@
+"""Export service for streaming the wallet request audit log."""
+
+import csv
+import io
+from typing import AsyncIterator, Sequence
+
+from app.core.exceptions import ValidationException
+
+EXPORT_COLUMNS = (
+    "id",
+    "address",
+    "balance",
+    "bandwidth",
+    "energy",
+    "request_timestamp",
+    "error_message",
+)
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+async def iter_csv(batches: AsyncIterator[Sequence[tuple]]) -> AsyncIterator[bytes]:
+    """Encode row batches as CSV, yielding one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    async for rows in batches:
+        writer.writerows(
+            (
+                row_id,
+                address,
+                balance,
+                bandwidth,
+                energy,
+                request_timestamp.isoformat(),
+                error_message
+            )
+            for row_id, address, balance, bandwidth, energy, request_timestamp, error_message in rows
+        )
+        yield _drain(buffer).encode()
+
+    tail = _drain(buffer)
+    if tail:
+        yield tail.encode()
+
+
+async def iter_parquet(batches: AsyncIterator[Sequence[tuple]]) -> AsyncIterator[bytes]:
+    """Encode row batches as Parquet, writing one row group per batch."""
+    pa, pq = _import_pyarrow()
+    schema = pa.schema([
+        ("id", pa.int64()),
+        ("address", pa.string()),
+        ("balance", pa.float64()),
+        ("bandwidth", pa.float64()),
+        ("energy", pa.float64()),
+        ("request_timestamp", pa.timestamp("us")),
+        ("error_message", pa.string()),
+    ])
+
+    buffer = io.BytesIO()
+    writer = pq.ParquetWriter(buffer, schema)
+    try:
+        async for rows in batches:
+            columns = list(zip(*rows))
+            writer.write_batch(pa.record_batch(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema
+            ))
+            chunk = _drain(buffer)
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+
+    yield _drain(buffer)
+
+
+def get_exporter(export_format: str):
+    """Get the streaming encoder for an export format."""
+    if export_format == "csv":
+        return iter_csv
+    if export_format == "parquet":
+        _import_pyarrow()
+        return iter_parquet
+    raise ValidationException(f"Unsupported export format: {export_format}")
+
+
+def _import_pyarrow():
+    """Import pyarrow lazily, since it is only needed for Parquet exports."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ValidationException("Parquet export requires pyarrow to be installed")
+    return pyarrow, pyarrow.parquet
+
+
+def _drain(buffer):
+    """Return buffered content and reset the buffer."""
+    value = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return value
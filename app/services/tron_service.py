@@ -1,13 +1,49 @@
 """TRON network service for blockchain interactions."""
 
 import asyncio
-from typing import Dict, Any, Optional
-from tronpy import Tron
-from tronpy.exceptions import ValidationError, ApiError, BadAddress
+import logging
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 from app.core.config import settings
-from app.core.exceptions import InvalidAddressException, TronNetworkException
-from app.schemas.wallet import WalletInfoResponse
+from app.core.deadline import with_deadline
+from app.core.exceptions import (
+    AppException,
+    DeadlineExceededException,
+    InvalidAddressException,
+    InvalidTokenException,
+    TronNetworkException,
+    WalletNotFoundException
+)
+from app.schemas.wallet import TokenBalance, WalletInfoResponse
+from app.services.wallet_cache import create_wallet_cache
+
+# tronpy and its crypto dependencies are slow to import, so they are only
+# imported when the first TronService is created
+if TYPE_CHECKING:
+    from tronpy import Tron
+    from tronpy.contract import Contract
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TokenContract:
+    """TRC-20 contract with its immutable metadata."""
+    
+    contract: "Contract"
+    symbol: str
+    decimals: int
+
+
+# Functions a contract must expose to be queried as a TRC-20 token
+TRC20_FUNCTIONS = frozenset({"symbol", "decimals", "balanceOf"})
+
+# Contract ABIs and metadata never change, so they are kept for the process
+# lifetime, least recently used first, up to TOKEN_CONTRACT_CACHE_MAX_ENTRIES
+_token_contracts: Dict[Tuple[str, str], TokenContract] = {}
 
 
 class TronService:
@@ -16,16 +52,20 @@ class TronService:
     def __init__(self):
         """Initialize TRON service with network configuration."""
         self._client = self._create_client()
+        self._cache = create_wallet_cache()
     
-    def _create_client(self) -> Tron:
+    def _create_client(self) -> "Tron":
         """Create TRON client based on network configuration."""
         try:
+            from tronpy import Tron
+            
+            conf = {"timeout": settings.tron_timeout_seconds}
             if settings.tron_network == "mainnet":
-                return Tron()
+                return Tron(conf=conf)
             elif settings.tron_network == "shasta":
-                return Tron(network="shasta")
+                return Tron(network="shasta", conf=conf)
             elif settings.tron_network == "nile":
-                return Tron(network="nile")
+                return Tron(network="nile", conf=conf)
             else:
                 raise TronNetworkException(f"Unsupported network: {settings.tron_network}")
         except Exception as e:
@@ -35,45 +75,159 @@ class TronService:
         """Validate TRON address format asynchronously."""
         try:
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self._client.is_address, address)
+            return await with_deadline(loop.run_in_executor(None, self._client.is_address, address))
+        except DeadlineExceededException:
+            raise
         except Exception:
             return False
     
-    async def get_wallet_info(self, address: str) -> WalletInfoResponse:
-        """Get wallet information including balance, bandwidth, and energy."""
-        if not await self.validate_address(address):
+    async def get_wallet_info(
+        self,
+        address: str,
+        tokens: Optional[List[str]] = None
+    ) -> WalletInfoResponse:
+        """Get wallet information including balance, bandwidth, energy and TRC-20 balances.
+        
+        Account, resource and token balance calls are issued concurrently, so
+        the whole lookup takes a single round of upstream requests.
+        """
+        from tronpy.exceptions import ValidationError, ApiError, BadAddress
+        
+        wallet_info = await self._cache.get(address)
+        cache_hit = wallet_info is not None
+        
+        if not cache_hit and not await self.validate_address(address):
             raise InvalidAddressException(f"Invalid TRON address: {address}")
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            account_info = await loop.run_in_executor(
-                None, self._client.get_account, address
-            )
-            
-            balance_sun = account_info.get('balance', 0)
-            balance_trx = balance_sun / 1_000_000
-            
-            resources = await loop.run_in_executor(
-                None, self._client.get_account_resource, address
-            )
-            
-            bandwidth = self._get_bandwidth_info(resources)
-            energy = self._get_energy_info(resources)
-            
-            return WalletInfoResponse(
-                address=address,
-                balance=balance_trx,
-                bandwidth=bandwidth,
-                energy=energy
-            )
-            
+            if cache_hit:
+                token_balances = await with_deadline(self._get_token_balances(address, tokens))
+            else:
+                wallet_info, token_balances = await with_deadline(asyncio.gather(
+                    self._fetch_wallet_info(address),
+                    self._get_token_balances(address, tokens)
+                ))
+                
+        except AppException:
+            raise
         except (ValidationError, BadAddress) as e:
             raise InvalidAddressException(f"Invalid address format: {str(e)}")
         except ApiError as e:
             raise TronNetworkException(f"TRON network error: {str(e)}")
         except Exception as e:
             raise TronNetworkException(f"Unexpected error: {str(e)}")
+        
+        if not cache_hit:
+            await self._cache.set(address, wallet_info)
+        
+        if tokens:
+            wallet_info = wallet_info.model_copy(update={"tokens": token_balances})
+        return wallet_info
+    
+    async def get_token_balances(self, address: str, tokens: List[str]) -> List[TokenBalance]:
+        """Get TRC-20 balances of an account, which need not be activated."""
+        from tronpy.exceptions import ApiError
+        
+        try:
+            return await with_deadline(self._get_token_balances(address, tokens))
+        except AppException:
+            raise
+        except ApiError as e:
+            raise TronNetworkException(f"TRON network error: {str(e)}")
+        except Exception as e:
+            raise TronNetworkException(f"Unexpected error: {str(e)}")
+    
+    async def _fetch_wallet_info(self, address: str) -> WalletInfoResponse:
+        """Fetch TRX balance and resources of an account from the network."""
+        from tronpy.exceptions import AddressNotFound
+        
+        loop = asyncio.get_event_loop()
+        
+        try:
+            account_info, resources = await asyncio.gather(
+                loop.run_in_executor(None, self._client.get_account, address),
+                loop.run_in_executor(None, self._client.get_account_resource, address)
+            )
+        except AddressNotFound:
+            raise WalletNotFoundException(f"Account not activated on-chain: {address}")
+        
+        balance_sun = account_info.get('balance', 0)
+        balance_trx = balance_sun / 1_000_000
+        
+        bandwidth = self._get_bandwidth_info(resources)
+        energy = self._get_energy_info(resources)
+        
+        return WalletInfoResponse(
+            address=address,
+            balance=balance_trx,
+            bandwidth=bandwidth,
+            energy=energy
+        )
+    
+    async def _get_token_balances(
+        self,
+        address: str,
+        tokens: Optional[List[str]]
+    ) -> List[TokenBalance]:
+        """Fetch TRC-20 balances of an account, one concurrent call per token."""
+        if not tokens:
+            return []
+        return list(await asyncio.gather(
+            *(self._get_token_balance(address, token) for token in dict.fromkeys(tokens))
+        ))
+    
+    async def _get_token_balance(self, address: str, token: str) -> TokenBalance:
+        """Fetch balance of a single TRC-20 token."""
+        token_contract = await self._get_token_contract(token)
+        loop = asyncio.get_event_loop()
+        raw_balance = await loop.run_in_executor(
+            None, token_contract.contract.functions.balanceOf, address
+        )
+        return TokenBalance(
+            contract_address=token,
+            symbol=token_contract.symbol,
+            decimals=token_contract.decimals,
+            raw_balance=raw_balance,
+            # Exact, since 18-decimal balances do not fit a float
+            balance=Decimal(raw_balance).scaleb(-token_contract.decimals)
+        )
+    
+    async def _get_token_contract(self, token: str) -> TokenContract:
+        """Get TRC-20 contract and metadata, loading them once per process."""
+        key = (settings.tron_network, token)
+        token_contract = _token_contracts.pop(key, None)
+        if token_contract is None:
+            if not await self.validate_address(token):
+                raise InvalidTokenException(f"Invalid TRC-20 contract address: {token}")
+            loop = asyncio.get_event_loop()
+            token_contract = await loop.run_in_executor(None, self._load_token_contract, token)
+            while len(_token_contracts) >= settings.token_contract_cache_max_entries:
+                _token_contracts.pop(next(iter(_token_contracts)))
+        # Re-inserted on every use, so the first entry is always the least recently used
+        _token_contracts[key] = token_contract
+        return token_contract
+    
+    def _load_token_contract(self, token: str) -> TokenContract:
+        """Load contract ABI, symbol and decimals from the network."""
+        from tronpy.exceptions import NotFound
+        
+        try:
+            contract = self._client.get_contract(token)
+        except NotFound:
+            raise InvalidTokenException(f"TRC-20 contract not found: {token}")
+        
+        # Non-contract addresses come back with an empty ABI instead of NotFound
+        functions = {
+            entry.get("name") for entry in contract.abi
+            if entry.get("type", "").lower() == "function"
+        }
+        if not TRC20_FUNCTIONS <= functions:
+            raise InvalidTokenException(f"Not a TRC-20 contract: {token}")
+        return TokenContract(
+            contract=contract,
+            symbol=contract.functions.symbol(),
+            decimals=contract.functions.decimals()
+        )
     
     def _get_bandwidth_info(self, resources: Dict[str, Any]) -> Optional[float]:
         """Extract bandwidth information from account resources."""
@@ -100,6 +254,33 @@ class TronService:
             return None
 
 
+_tron_service: Optional[TronService] = None
+_tron_service_lock = threading.Lock()
+
+
 def get_tron_service() -> TronService:
-    """Dependency injection for TronService."""
-    return TronService()
+    """Dependency injection for TronService.
+    
+    The service and its TRON client are created once per process and shared
+    by all requests.
+    """
+    global _tron_service
+    if _tron_service is None:
+        with _tron_service_lock:
+            if _tron_service is None:
+                _tron_service = TronService()
+    return _tron_service
+
+
+def is_tron_service_ready() -> bool:
+    """Check whether the shared TronService has been created."""
+    return _tron_service is not None
+
+
+async def warm_up_tron_service() -> None:
+    """Import tronpy and create the shared TronService in the background."""
+    try:
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, get_tron_service)
+    except Exception as e:
+        logger.error(f"Failed to warm up TRON service: {str(e)}")
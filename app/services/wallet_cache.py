@@ -0,0 +1,182 @@
+"""Caches for wallet information snapshots."""
+
+import time
+from array import array
+from typing import Dict, List, Optional
+
+import base58
+
+from app.core.cache import CacheBackend, MemoryCacheBackend, get_cache_backend
+from app.core.config import settings
+from app.schemas.wallet import WalletInfoResponse
+
+SUN_PER_TRX = 1_000_000
+
+# Stored in place of missing (None) numeric fields
+_MISSING = -1
+
+# Reasons kept in the negative cache
+INVALID_ADDRESS = "invalid_address"
+ACCOUNT_NOT_FOUND = "account_not_found"
+
+
+class BackendWalletCache:
+    """Wallet cache storing JSON snapshots in a CacheBackend."""
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        """Initialize cache on top of ``backend``."""
+        self._backend = backend
+        self._ttl = ttl
+
+    async def get(self, address: str) -> Optional[WalletInfoResponse]:
+        """Get cached wallet info, or None when missing or expired."""
+        cached = await self._backend.get(f"wallet:{settings.tron_network}:{address}")
+        if cached is None:
+            return None
+        return WalletInfoResponse.model_validate_json(cached)
+
+    async def set(self, address: str, wallet_info: WalletInfoResponse) -> None:
+        """Cache wallet info."""
+        await self._backend.set(
+            f"wallet:{settings.tron_network}:{address}",
+            wallet_info.model_dump_json().encode(),
+            self._ttl
+        )
+
+
+class NegativeWalletCache:
+    """Cache of addresses known to be invalid or not activated on-chain."""
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        """Initialize cache on top of ``backend``."""
+        self._backend = backend
+        self._ttl = ttl
+
+    async def get(self, address: str) -> Optional[str]:
+        """Get the reason an address was negatively cached, or None."""
+        cached = await self._backend.get(f"negative:{settings.tron_network}:{address}")
+        return cached.decode() if cached is not None else None
+
+    async def set(self, address: str, reason: str) -> None:
+        """Remember that lookups of ``address`` fail for ``reason``."""
+        await self._backend.set(
+            f"negative:{settings.tron_network}:{address}",
+            reason.encode(),
+            self._ttl
+        )
+
+
+class WalletSnapshotStore:
+    """Compact in-process wallet cache.
+
+    Addresses are kept as 21-byte decoded keys mapping to a slot in
+    fixed-width column arrays, so a cached wallet costs a small, constant
+    number of bytes. Pydantic models are only built when a snapshot is read.
+    Token balances are not stored.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        """Initialize store holding at most ``max_entries`` wallets."""
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._slots: Dict[bytes, int] = {}
+        self._free: List[int] = []
+        self._balance = array("q")
+        self._bandwidth = array("q")
+        self._energy = array("q")
+        self._expires_at = array("d")
+
+    def __len__(self) -> int:
+        """Number of stored snapshots, including expired ones not yet evicted."""
+        return len(self._slots)
+
+    async def get(self, address: str) -> Optional[WalletInfoResponse]:
+        """Get cached wallet info, or None when missing or expired."""
+        key = _address_key(address)
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        if self._expires_at[slot] < time.monotonic():
+            self._free.append(self._slots.pop(key))
+            return None
+
+        balance = self._balance[slot]
+        return WalletInfoResponse(
+            address=address,
+            balance=None if balance == _MISSING else balance / SUN_PER_TRX,
+            bandwidth=_from_stored(self._bandwidth[slot]),
+            energy=_from_stored(self._energy[slot])
+        )
+
+    async def set(self, address: str, wallet_info: WalletInfoResponse) -> None:
+        """Cache wallet info, evicting the oldest snapshot when full."""
+        key = _address_key(address)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._allocate()
+            self._slots[key] = slot
+
+        balance = wallet_info.balance
+        self._balance[slot] = _MISSING if balance is None else round(balance * SUN_PER_TRX)
+        self._bandwidth[slot] = _to_stored(wallet_info.bandwidth)
+        self._energy[slot] = _to_stored(wallet_info.energy)
+        self._expires_at[slot] = time.monotonic() + self._ttl
+
+    def _allocate(self) -> int:
+        """Get a free slot, growing the arrays or evicting the oldest entry."""
+        if self._free:
+            return self._free.pop()
+        if len(self._slots) >= self._max_entries:
+            return self._slots.pop(next(iter(self._slots)))
+        self._balance.append(0)
+        self._bandwidth.append(0)
+        self._energy.append(0)
+        self._expires_at.append(0.0)
+        return len(self._balance) - 1
+
+
+def _address_key(address: str) -> bytes:
+    """Decode a TRON address to its 21 raw bytes."""
+    try:
+        if len(address) == 42 and address.startswith("41"):
+            return bytes.fromhex(address)
+        return base58.b58decode_check(address)
+    except ValueError:
+        # Not a decodable address, keep it verbatim so it still has a unique key
+        return address.encode()
+
+
+def _to_stored(value: Optional[float]) -> int:
+    """Convert an optional resource amount to its stored integer."""
+    return _MISSING if value is None else int(value)
+
+
+def _from_stored(value: int) -> Optional[float]:
+    """Convert a stored integer back to an optional resource amount."""
+    return None if value == _MISSING else float(value)
+
+
+def create_wallet_cache():
+    """Create wallet cache based on configuration."""
+    if settings.cache_backend == "memory":
+        return WalletSnapshotStore(settings.cache_max_entries, settings.cache_ttl_seconds)
+    return BackendWalletCache(get_cache_backend(), settings.cache_ttl_seconds)
+
+
+_negative_wallet_cache: Optional[NegativeWalletCache] = None
+
+
+def get_negative_wallet_cache() -> NegativeWalletCache:
+    """Get the process-wide negative wallet cache.
+
+    With the memory backend it gets its own store, so junk traffic cannot
+    evict positive entries; other backends keep it under a separate key prefix.
+    """
+    global _negative_wallet_cache
+    if _negative_wallet_cache is None:
+        if settings.cache_backend == "memory":
+            backend = MemoryCacheBackend(settings.negative_cache_max_entries)
+        else:
+            backend = get_cache_backend()
+        _negative_wallet_cache = NegativeWalletCache(backend, settings.negative_cache_ttl_seconds)
+    return _negative_wallet_cache
@@ -1,16 +1,45 @@
 """Wallet service for business logic and database operations."""
 
-import json
 import math
-from datetime import datetime
-from typing import List, Tuple
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import desc, select, func
+from pydantic import TypeAdapter
+from sqlalchemy import BigInteger, Integer, cast, desc, extract, select, func
 
-from app.core.exceptions import DatabaseException
+from app.core.config import settings
+from app.core.deadline import check_deadline
+from app.core.exceptions import (
+    DatabaseException,
+    DeadlineExceededException,
+    InvalidAddressException,
+    ValidationException,
+    WalletNotFoundException
+)
 from app.models.wallet_request import WalletRequest
-from app.schemas.wallet import WalletInfoResponse, WalletRequestRecord, WalletRequestsResponse
+from app.services.export_service import EXPORT_COLUMNS
+from app.schemas.wallet import (
+    MetricStats,
+    TokenBalance,
+    WalletHistoryPoint,
+    WalletHistoryResponse,
+    WalletInfoResponse,
+    WalletRequestRecord,
+    WalletRequestsResponse
+)
 from app.services.tron_service import TronService
+from app.services.wallet_cache import (
+    ACCOUNT_NOT_FOUND,
+    INVALID_ADDRESS,
+    get_negative_wallet_cache
+)
+
+# Validates a whole page of rows in a single pydantic-core call
+_records_adapter = TypeAdapter(List[WalletRequestRecord])
+
+# Only the columns exposed by WalletRequestRecord, so large payloads such as
+# response_data are never read and no ORM entities are materialized
+_record_columns = tuple(getattr(WalletRequest, name) for name in WalletRequestRecord.model_fields)
 
 
 class WalletService:
@@ -19,16 +48,39 @@ class WalletService:
     def __init__(self, tron_service: TronService):
         """Initialize wallet service with dependencies."""
         self.tron_service = tron_service
+        self.negative_cache = get_negative_wallet_cache()
     
-    async def get_wallet_info_and_save(self, address: str, db: AsyncSession) -> WalletInfoResponse:
-        """Get wallet information from TRON network and save request to database."""
-        error_message = None
+    async def get_wallet_info_and_save(
+        self,
+        address: str,
+        db: AsyncSession,
+        tokens: Optional[List[str]] = None
+    ) -> WalletInfoResponse:
+        """Get wallet information from TRON network and save request to database.
+        
+        Addresses recently found to be invalid or not activated are answered
+        from the negative cache, without an upstream call or a new audit row.
+        Accounts that do not exist on-chain get a zero balance response.
+        Only the address itself failing validation is cached as invalid, not
+        a bad token contract.
+        """
+        negative = await self.negative_cache.get(address)
+        if negative == INVALID_ADDRESS:
+            raise InvalidAddressException(f"Invalid TRON address: {address}")
+        if negative == ACCOUNT_NOT_FOUND:
+            return await self._get_unactivated_wallet_info(address, tokens)
+        
+        error = None
         wallet_info = None
         
         try:
-            wallet_info = await self.tron_service.get_wallet_info(address)
+            wallet_info = await self._get_wallet_info(address, tokens)
+        except DeadlineExceededException:
+            raise
         except Exception as e:
-            error_message = str(e)
+            if isinstance(e, InvalidAddressException):
+                await self.negative_cache.set(address, INVALID_ADDRESS)
+            error = e
             wallet_info = WalletInfoResponse(
                 address=address,
                 balance=None,
@@ -36,21 +88,49 @@ class WalletService:
                 energy=None
             )
         
+        # Nobody is waiting for the result anymore, so don't spend a write on it
+        check_deadline()
+        
         try:
             await self._save_wallet_request(
                 db=db,
                 address=address,
                 wallet_info=wallet_info,
-                error_message=error_message
+                error_message=str(error) if error else None
             )
         except Exception as e:
             raise DatabaseException(f"Failed to save wallet request: {str(e)}")
         
-        if error_message:
-            raise Exception(error_message)
+        if error:
+            raise error
         
         return wallet_info
     
+    async def _get_wallet_info(
+        self,
+        address: str,
+        tokens: Optional[List[str]]
+    ) -> WalletInfoResponse:
+        """Get wallet information, remembering accounts not activated on-chain."""
+        try:
+            return await self.tron_service.get_wallet_info(address, tokens)
+        except WalletNotFoundException:
+            await self.negative_cache.set(address, ACCOUNT_NOT_FOUND)
+            return await self._get_unactivated_wallet_info(address, tokens)
+    
+    async def _get_unactivated_wallet_info(
+        self,
+        address: str,
+        tokens: Optional[List[str]]
+    ) -> WalletInfoResponse:
+        """Build response for an unactivated account with the requested token balances.
+        
+        TRC-20 balances live in contract storage, so an address can hold
+        tokens before its account is activated.
+        """
+        token_balances = await self.tron_service.get_token_balances(address, tokens) if tokens else None
+        return unactivated_wallet_info(address, token_balances)
+    
     async def _save_wallet_request(
         self,
         db: AsyncSession,
@@ -63,12 +143,7 @@ class WalletService:
             # Prepare response data
             response_data = None
             if not error_message:
-                response_data = json.dumps({
-                    "address": wallet_info.address,
-                    "balance": wallet_info.balance,
-                    "bandwidth": wallet_info.bandwidth,
-                    "energy": wallet_info.energy
-                })
+                response_data = wallet_info.model_dump_json()
             
             wallet_request = WalletRequest(
                 address=address,
@@ -105,26 +180,15 @@ class WalletService:
             total = count_result.scalar()
             
             stmt = (
-                select(WalletRequest)
+                select(*_record_columns)
                 .order_by(desc(WalletRequest.request_timestamp))
                 .offset(offset)
                 .limit(page_size)
             )
             result = await db.execute(stmt)
-            records = result.scalars().all()
+            records = result.all()
             
-            wallet_records = [
-                WalletRequestRecord(
-                    id=record.id,
-                    address=record.address,
-                    balance=record.balance,
-                    bandwidth=record.bandwidth,
-                    energy=record.energy,
-                    request_timestamp=record.request_timestamp,
-                    error_message=record.error_message
-                )
-                for record in records
-            ]
+            wallet_records = _records_adapter.validate_python(records, from_attributes=True)
             
             total_pages = math.ceil(total / page_size) if total > 0 else 1
             
@@ -139,6 +203,172 @@ class WalletService:
         except Exception as e:
             raise DatabaseException(f"Failed to retrieve wallet requests: {str(e)}")
 
+    
+    async def get_wallet_history(
+        self,
+        db: AsyncSession,
+        address: str,
+        start: datetime,
+        end: datetime,
+        resolution: int
+    ) -> WalletHistoryResponse:
+        """Get downsampled balance, bandwidth and energy history for an address.
+        
+        Successful requests in ``[start, end)`` are grouped into buckets of
+        ``resolution`` seconds and aggregated in SQL, so only one row per bucket
+        leaves the database.
+        """
+        start = _to_naive_utc(start)
+        end = _to_naive_utc(end)
+        if end <= start:
+            raise ValidationException("History range end must be after start")
+        
+        bucket_count = math.ceil((end - start).total_seconds() / resolution)
+        if bucket_count > settings.history_max_points:
+            raise ValidationException(
+                f"Requested range produces {bucket_count} points, "
+                f"maximum is {settings.history_max_points}",
+                details={"max_points": settings.history_max_points}
+            )
+        
+        try:
+            bucket = _epoch_seconds(WalletRequest.request_timestamp, db.bind.dialect.name) // resolution
+            
+            buckets = (
+                select(
+                    bucket.label("bucket"),
+                    func.count(WalletRequest.id).label("samples"),
+                    func.min(WalletRequest.balance).label("balance_min"),
+                    func.max(WalletRequest.balance).label("balance_max"),
+                    func.avg(WalletRequest.balance).label("balance_avg"),
+                    func.min(WalletRequest.bandwidth).label("bandwidth_min"),
+                    func.max(WalletRequest.bandwidth).label("bandwidth_max"),
+                    func.avg(WalletRequest.bandwidth).label("bandwidth_avg"),
+                    func.min(WalletRequest.energy).label("energy_min"),
+                    func.max(WalletRequest.energy).label("energy_max"),
+                    func.avg(WalletRequest.energy).label("energy_avg"),
+                    func.max(WalletRequest.id).label("last_id")
+                )
+                .where(
+                    WalletRequest.address == address,
+                    WalletRequest.error_message.is_(None),
+                    WalletRequest.request_timestamp >= start,
+                    WalletRequest.request_timestamp < end
+                )
+                .group_by(bucket)
+                .subquery()
+            )
+            
+            # Join back on the newest row of every bucket to pick the "last" values
+            stmt = (
+                select(
+                    buckets,
+                    WalletRequest.balance.label("balance_last"),
+                    WalletRequest.bandwidth.label("bandwidth_last"),
+                    WalletRequest.energy.label("energy_last")
+                )
+                .join(WalletRequest, WalletRequest.id == buckets.c.last_id)
+                .order_by(buckets.c.bucket)
+            )
+            result = await db.execute(stmt)
+            rows = result.all()
+        except Exception as e:
+            raise DatabaseException(f"Failed to retrieve wallet history: {str(e)}")
+        
+        points = [
+            WalletHistoryPoint(
+                bucket_start=datetime.utcfromtimestamp(row.bucket * resolution),
+                samples=row.samples,
+                balance=MetricStats(
+                    min=row.balance_min,
+                    max=row.balance_max,
+                    avg=row.balance_avg,
+                    last=row.balance_last
+                ),
+                bandwidth=MetricStats(
+                    min=row.bandwidth_min,
+                    max=row.bandwidth_max,
+                    avg=row.bandwidth_avg,
+                    last=row.bandwidth_last
+                ),
+                energy=MetricStats(
+                    min=row.energy_min,
+                    max=row.energy_max,
+                    avg=row.energy_avg,
+                    last=row.energy_last
+                )
+            )
+            for row in rows
+        ]
+        
+        return WalletHistoryResponse(
+            address=address,
+            start=start,
+            end=end,
+            resolution=resolution,
+            points=points
+        )
+
+    
+    async def stream_wallet_requests(
+        self,
+        db: AsyncSession,
+        address: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[tuple]]:
+        """Stream wallet requests in batches of plain tuples.
+        
+        Rows are fetched through a server-side cursor, so memory usage stays
+        bounded by ``chunk_size`` regardless of the table size.
+        """
+        stmt = select(*(getattr(WalletRequest, column) for column in EXPORT_COLUMNS))
+        if address is not None:
+            stmt = stmt.where(WalletRequest.address == address)
+        if start is not None:
+            stmt = stmt.where(WalletRequest.request_timestamp >= _to_naive_utc(start))
+        if end is not None:
+            stmt = stmt.where(WalletRequest.request_timestamp < _to_naive_utc(end))
+        stmt = stmt.order_by(WalletRequest.id).execution_options(yield_per=chunk_size)
+        
+        try:
+            result = await db.stream(stmt)
+            async for partition in result.partitions():
+                yield [tuple(row) for row in partition]
+        except Exception as e:
+            raise DatabaseException(f"Failed to export wallet requests: {str(e)}")
+
+
+def unactivated_wallet_info(
+    address: str,
+    tokens: Optional[List[TokenBalance]] = None
+) -> WalletInfoResponse:
+    """Build response for an address that has no account on-chain."""
+    return WalletInfoResponse(
+        address=address,
+        balance=0.0,
+        bandwidth=0.0,
+        energy=0.0,
+        tokens=tokens,
+        activated=False
+    )
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Convert datetime to naive UTC, matching how request timestamps are stored."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _epoch_seconds(column, dialect_name: str):
+    """Build a SQL expression returning the Unix timestamp of a datetime column."""
+    if dialect_name == "sqlite":
+        return cast(func.strftime('%s', column), Integer)
+    # floor, so fractional seconds are truncated like strftime('%s') instead of rounded
+    return cast(func.floor(extract('epoch', column)), BigInteger)
+
 
 def get_wallet_service(tron_service: TronService) -> WalletService:
     """Dependency injection for WalletService."""
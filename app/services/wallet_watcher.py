@@ -0,0 +1,178 @@
+"""Shared poller pushing live wallet updates to subscribers."""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+
+from app.core.config import settings
+from app.core.deadline import clear_deadline
+from app.core.exceptions import WalletNotFoundException
+from app.schemas.wallet import WalletInfoResponse
+from app.services.tron_service import TronService
+from app.services.wallet_service import unactivated_wallet_info
+
+logger = logging.getLogger(__name__)
+
+# Idle connections get a comment line this often, so disconnects are noticed
+KEEPALIVE_SECONDS = 15.0
+
+
+class Subscription:
+    """Pending wallet changes of one connected client.
+
+    Changes not yet sent are merged per address, so memory stays bounded by
+    the number of subscribed addresses no matter how slow the client reads.
+    """
+
+    def __init__(self, addresses: Iterable[str]):
+        """Initialize subscription to ``addresses``."""
+        self.addresses = frozenset(addresses)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._ready = asyncio.Event()
+
+    def push(self, address: str, changes: Dict[str, Any]) -> None:
+        """Queue changed fields of a wallet."""
+        self._pending.setdefault(address, {}).update(changes)
+        self._ready.set()
+
+    async def next_changes(self, timeout: float) -> Dict[str, Dict[str, Any]]:
+        """Wait for and take all pending changes, empty on timeout."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return {}
+        self._ready.clear()
+        changes, self._pending = self._pending, {}
+        return changes
+
+
+class WalletWatcher:
+    """Polls each watched address once per interval and fans out the changes.
+
+    However many clients watch an address, it is fetched once per interval.
+    The polling task only runs while there are subscribers.
+    """
+
+    def __init__(self, tron_service: TronService, interval: float, max_concurrency: int):
+        """Initialize watcher with polling configuration."""
+        self.tron_service = tron_service
+        self._interval = interval
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, addresses: Iterable[str]) -> Subscription:
+        """Register a subscription and start polling if needed."""
+        subscription = Subscription(addresses)
+        for address in subscription.addresses:
+            self._subscribers.setdefault(address, set()).add(subscription)
+            if address in self._snapshots:
+                subscription.push(address, self._snapshots[address])
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription and stop polling when nobody is left."""
+        for address in subscription.addresses:
+            subscribers = self._subscribers.get(address)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[address]
+                self._snapshots.pop(address, None)
+
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def close(self) -> None:
+        """Stop polling."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def poll(self) -> None:
+        """Fetch every watched address once and push changes to subscribers."""
+        addresses = list(self._subscribers)
+        results = await asyncio.gather(*(self._fetch(address) for address in addresses))
+
+        for address, wallet_info in zip(addresses, results):
+            subscribers = self._subscribers.get(address)
+            if wallet_info is None or not subscribers:
+                continue
+
+            current = wallet_info.model_dump(mode="json", exclude={"address", "tokens"})
+            previous = self._snapshots.get(address, {})
+            changes = {key: value for key, value in current.items() if previous.get(key) != value}
+            if not changes:
+                continue
+
+            self._snapshots[address] = current
+            for subscription in subscribers:
+                subscription.push(address, changes)
+
+    async def _run(self) -> None:
+        """Poll until cancelled."""
+        # Started from a subscribe request, but must outlive that request's deadline
+        clear_deadline()
+        while True:
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.error(f"Wallet watcher poll failed: {str(e)}")
+            await asyncio.sleep(self._interval)
+
+    async def _fetch(self, address: str) -> Optional[WalletInfoResponse]:
+        """Fetch wallet info, returning None when it is unavailable this round."""
+        async with self._semaphore:
+            try:
+                return await self.tron_service.get_wallet_info(address)
+            except WalletNotFoundException:
+                return unactivated_wallet_info(address)
+            except Exception as e:
+                logger.warning(f"Failed to poll wallet {address}: {str(e)}")
+                return None
+
+
+async def iter_events(watcher: WalletWatcher, addresses: Iterable[str]) -> AsyncIterator[str]:
+    """Subscribe to ``addresses`` and encode their changes as server-sent events.
+
+    The subscription lives exactly as long as the stream is consumed.
+    """
+    subscription = watcher.subscribe(addresses)
+    try:
+        while True:
+            changes = await subscription.next_changes(KEEPALIVE_SECONDS)
+            if not changes:
+                yield ": keepalive\n\n"
+                continue
+            for address, fields in changes.items():
+                yield f"event: wallet\ndata: {json.dumps({'address': address, **fields})}\n\n"
+    finally:
+        watcher.unsubscribe(subscription)
+
+
+_wallet_watcher: Optional[WalletWatcher] = None
+
+
+def get_wallet_watcher(tron_service: TronService) -> WalletWatcher:
+    """Get the process-wide wallet watcher."""
+    global _wallet_watcher
+    if _wallet_watcher is None:
+        _wallet_watcher = WalletWatcher(
+            tron_service,
+            interval=settings.watch_interval_seconds,
+            max_concurrency=settings.watch_max_concurrency
+        )
+    return _wallet_watcher
+
+
+async def shutdown_wallet_watcher() -> None:
+    """Stop the process-wide wallet watcher, if any."""
+    if _wallet_watcher is not None:
+        await _wallet_watcher.close()
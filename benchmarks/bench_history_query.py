@@ -0,0 +1,75 @@
+"""Benchmark the paginated wallet requests query.
+
+Compares loading full ``WalletRequest`` entities with selecting only the
+columns exposed by ``WalletRequestRecord``.
+
+Usage: python -m benchmarks.bench_history_query
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models.wallet_request import Base, WalletRequest
+from app.services.wallet_service import _record_columns
+
+ROWS = 5000
+PAGE_SIZE = 100
+ROUNDS = 200
+RESPONSE_DATA_SIZE = 2048
+
+
+async def populate(engine):
+    """Create the table and insert sample requests."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as db:
+        db.add_all(
+            WalletRequest(
+                address=f"TTestAddress{i:030d}",
+                balance=float(i),
+                bandwidth=1500.0,
+                energy=65000.0,
+                request_timestamp=datetime(2026, 1, 1) + timedelta(seconds=i),
+                response_data="x" * RESPONSE_DATA_SIZE
+            )
+            for i in range(ROWS)
+        )
+        await db.commit()
+
+
+async def run(engine, name, stmt, fetch):
+    """Time fetching one page ROUNDS times."""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        async with AsyncSession(engine) as db:
+            fetch(await db.execute(stmt))
+    elapsed = time.perf_counter() - started
+    print(f"{name:<30} {elapsed / ROUNDS * 1e6:10.1f} us/page")
+
+
+async def main():
+    """Run query benchmarks."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    await populate(engine)
+    print(f"{ROWS} rows with {RESPONSE_DATA_SIZE} bytes of response_data, page of {PAGE_SIZE}")
+
+    order = (desc(WalletRequest.request_timestamp),)
+    await run(
+        engine, "full ORM entities",
+        select(WalletRequest).order_by(*order).limit(PAGE_SIZE),
+        lambda result: result.scalars().all()
+    )
+    await run(
+        engine, "projected record columns",
+        select(*_record_columns).order_by(*order).limit(PAGE_SIZE),
+        lambda result: result.all()
+    )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""Benchmark JSON serialization of API responses.
+
+Compares FastAPI's default response path (re-validation, ``jsonable_encoder``
+and ``json.dumps``) with handing the model straight to ``ModelJSONResponse``.
+
+Usage: python -m benchmarks.bench_serialization
+"""
+
+import asyncio
+import timeit
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import TypeAdapter
+
+from app.core.responses import ModelJSONResponse
+from app.schemas.wallet import WalletRequestRecord, WalletRequestsResponse
+
+PAGE_SIZE = 100
+ROUNDS = 2000
+
+
+def make_rows():
+    """Build ORM-like rows for one history page."""
+    return [
+        SimpleNamespace(
+            id=i,
+            address=f"TTestAddress{i:030d}",
+            balance=100.5 + i,
+            bandwidth=1500.0,
+            energy=65000.0,
+            request_timestamp=datetime(2026, 1, 1, 12, 0, i % 60),
+            error_message=None
+        )
+        for i in range(PAGE_SIZE)
+    ]
+
+
+def build_by_fields(rows):
+    """Build records field by field (previous implementation)."""
+    return [
+        WalletRequestRecord(
+            id=row.id,
+            address=row.address,
+            balance=row.balance,
+            bandwidth=row.bandwidth,
+            energy=row.energy,
+            request_timestamp=row.request_timestamp,
+            error_message=row.error_message
+        )
+        for row in rows
+    ]
+
+
+def build_by_validate(rows):
+    """Build records from attributes with model_validate per row."""
+    return [WalletRequestRecord.model_validate(row) for row in rows]
+
+
+def build_by_adapter(rows, adapter=TypeAdapter(List[WalletRequestRecord])):
+    """Build the whole page from attributes in one validation call."""
+    return adapter.validate_python(rows, from_attributes=True)
+
+
+def make_page(records):
+    """Wrap records into a paginated response."""
+    return WalletRequestsResponse(
+        records=records, total=PAGE_SIZE, page=1, page_size=PAGE_SIZE, total_pages=1
+    )
+
+
+def report(name, seconds):
+    """Print per-call timing."""
+    print(f"{name:<45} {seconds / ROUNDS * 1e6:10.1f} us/op")
+
+
+def main():
+    """Run serialization benchmarks."""
+    rows = make_rows()
+    page = make_page(build_by_adapter(rows))
+    field = create_response_field(name="response", type_=WalletRequestsResponse)
+    loop = asyncio.new_event_loop()
+
+    def fastapi_default():
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=page, is_coroutine=True)
+        )
+        return JSONResponse(content).body
+
+    def model_json_response():
+        return ModelJSONResponse(page).body
+
+    print(f"Page of {PAGE_SIZE} records, {ROUNDS} rounds")
+    report("build records field by field", timeit.timeit(lambda: build_by_fields(rows), number=ROUNDS))
+    report("build records with model_validate per row", timeit.timeit(lambda: build_by_validate(rows), number=ROUNDS))
+    report("build records with list TypeAdapter", timeit.timeit(lambda: build_by_adapter(rows), number=ROUNDS))
+    report("serialize via FastAPI default path", timeit.timeit(fastapi_default, number=ROUNDS))
+    report("serialize via ModelJSONResponse", timeit.timeit(model_json_response, number=ROUNDS))
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark memory used per cached wallet.
+
+Compares keeping ``WalletInfoResponse`` models in a dict, JSON snapshots in
+``MemoryCacheBackend`` and the compact ``WalletSnapshotStore``.
+
+Usage: python -m benchmarks.bench_snapshot_memory
+"""
+
+import asyncio
+import gc
+import os
+import tracemalloc
+
+import base58
+
+from app.core.cache import MemoryCacheBackend
+from app.schemas.wallet import WalletInfoResponse
+from app.services.wallet_cache import BackendWalletCache, WalletSnapshotStore
+
+WALLETS = 100_000
+
+
+def make_wallets():
+    """Create random wallet snapshots."""
+    wallets = []
+    for i in range(WALLETS):
+        address = base58.b58encode_check(b"\x41" + os.urandom(20)).decode()
+        wallets.append(WalletInfoResponse(
+            address=address,
+            balance=i * 1.234567,
+            bandwidth=float(600 - i % 600),
+            energy=float(i % 100_000)
+        ))
+    return wallets
+
+
+async def fill_models(wallets):
+    """Cache wallets as Pydantic models keyed by address."""
+    return {wallet.address: wallet.model_copy() for wallet in wallets}
+
+
+async def fill_cache(cache, wallets):
+    """Cache wallets through a wallet cache."""
+    for wallet in wallets:
+        await cache.set(wallet.address, wallet)
+    return cache
+
+
+async def measure(name, fill):
+    """Print traced memory growth per wallet while running ``fill``."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cache = await fill
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{name:<35} {(after - before) / WALLETS:8.1f} bytes/wallet")
+    return cache
+
+
+async def main():
+    """Run memory benchmarks."""
+    wallets = make_wallets()
+    print(f"{WALLETS} cached wallets")
+    await measure("dict of WalletInfoResponse", fill_models(wallets))
+    await measure("JSON in MemoryCacheBackend", fill_cache(
+        BackendWalletCache(MemoryCacheBackend(WALLETS), ttl=60), wallets
+    ))
+    await measure("WalletSnapshotStore", fill_cache(WalletSnapshotStore(WALLETS, ttl=60), wallets))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
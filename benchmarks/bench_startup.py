@@ -0,0 +1,71 @@
+"""Benchmark service cold start.
+
+Each run starts a fresh interpreter and measures how long it takes to
+import ``app.main``, to answer the first request after startup and to
+become ready (TRON client created and database reachable).
+
+Usage: python -m benchmarks.bench_startup
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RUNS = 5
+
+PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+from httpx import AsyncClient
+
+async def main():
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(app=app, base_url="http://bench") as client:
+            await client.get("/health/live")
+            first_request = time.perf_counter()
+            while (await client.get("/health/ready")).status_code != 200:
+                await asyncio.sleep(0.005)
+            ready = time.perf_counter()
+    print(json.dumps({
+        "import": imported - started,
+        "first_request": first_request - started,
+        "ready": ready - started,
+    }))
+
+asyncio.run(main())
+"""
+
+
+def run_once(database_url):
+    """Run one cold start in a subprocess and return its timings."""
+    env = dict(os.environ, DATABASE_URL=database_url)
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    """Run startup benchmarks."""
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{directory}/bench.db"
+        runs = [run_once(database_url) for _ in range(RUNS)]
+
+    print(f"Cold start, median of {RUNS} runs")
+    for name in ("import", "first_request", "ready"):
+        median = statistics.median(run[name] for run in runs)
+        print(f"{name:<20} {median * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
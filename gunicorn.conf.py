@@ -0,0 +1,29 @@
+"""Gunicorn configuration for running multiple uvicorn workers."""
+
+import asyncio
+import multiprocessing
+
+from app.core.config import settings
+
+bind = f"{settings.host}:{settings.port}"
+workers = settings.workers or multiprocessing.cpu_count()
+worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def on_starting(server):
+    """Create the database schema once in the master, before workers are forked."""
+    if not settings.create_schema_on_startup:
+        return
+
+    from app.db.database import engine, init_db
+
+    async def create_schema():
+        try:
+            await init_db()
+        finally:
+            # Workers must not inherit connections opened by the master
+            await engine.dispose()
+
+    asyncio.run(create_schema())
+    # Forked workers share these settings, so they skip concurrent create_all
+    settings.create_schema_on_startup = False
@@ -0,0 +1,60 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+import pytest_asyncio
+from unittest.mock import Mock
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+
+from app.core.cache import NullCacheBackend
+from app.models.wallet_request import Base
+from app.services import tron_service as tron_service_module
+from app.services.wallet_cache import BackendWalletCache
+from app.services.wallet_service import WalletService
+from app.services.tron_service import TronService
+
+
+@pytest_asyncio.fixture
+async def async_engine():
+    """Create async in-memory SQLite engine with the schema created."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def async_db(async_engine):
+    """Create async session on the in-memory SQLite engine."""
+    async with async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture
+def wallet_service():
+    """Create wallet service with mocked dependencies."""
+    return WalletService(Mock(spec=TronService))
+
+
+@pytest.fixture
+def tron_service():
+    """Create TRON service with a mocked client and no cache.
+
+    By default the client reports an activated account holding 1 TRX and a
+    6-decimal TRC-20 contract holding 12.345678 tokens; tests reconfigure
+    ``_client`` for other accounts and contracts.
+    """
+    tron_service_module._token_contracts.clear()
+    service = TronService()
+    service._cache = BackendWalletCache(NullCacheBackend(), ttl=60)
+    service._client = Mock()
+    service._client.is_address.side_effect = lambda value: value.startswith("T")
+    service._client.get_account.return_value = {"balance": 1_000_000}
+    service._client.get_account_resource.return_value = {}
+    contract = service._client.get_contract.return_value
+    contract.abi = [{"type": "Function", "name": name} for name in ("symbol", "decimals", "balanceOf")]
+    contract.functions.symbol.return_value = "USDT"
+    contract.functions.decimals.return_value = 6
+    contract.functions.balanceOf.return_value = 12_345_678
+    yield service
+    tron_service_module._token_contracts.clear()
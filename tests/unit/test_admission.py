@@ -0,0 +1,184 @@
+"""Unit tests for admission control."""
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app.core import deadline
+from app.core.admission import (
+    AdmissionControlMiddleware,
+    PriorityClass,
+    check_database_budget,
+    get_priority_classes
+)
+from app.core.config import settings
+
+INFO_PATH = "/api/v1/wallet/info"
+EXPORT_PATH = "/api/v1/wallet/requests/export"
+
+
+def make_app(release: asyncio.Event, started: list):
+    """Create an ASGI app whose requests block until ``release`` is set."""
+    async def app(scope, receive, send):
+        started.append(scope["path"])
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return app
+
+
+def make_middleware(app, queue_timeout: float = 1.0) -> AdmissionControlMiddleware:
+    """Wrap ``app`` with one slot and one queue place per class."""
+    return AdmissionControlMiddleware(app, priority_classes=[
+        PriorityClass(name="interactive", rank=0, max_concurrency=1, max_queue=1, queue_timeout=queue_timeout),
+        PriorityClass(name="batch", rank=2, max_concurrency=1, max_queue=1, queue_timeout=queue_timeout),
+    ])
+
+
+class TestAdmissionControlMiddleware:
+    """Unit tests for AdmissionControlMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_queued_request_is_admitted(self):
+        """Test a request waiting in the queue runs once a slot frees up."""
+        release, started = asyncio.Event(), []
+        middleware = make_middleware(make_app(release, started))
+
+        async with AsyncClient(app=middleware, base_url="http://test") as client:
+            first = asyncio.create_task(client.get(INFO_PATH))
+            second = asyncio.create_task(client.get(INFO_PATH))
+            await asyncio.sleep(0.05)
+            assert len(started) == 1
+
+            release.set()
+            responses = await asyncio.gather(first, second)
+
+        assert [response.status_code for response in responses] == [200, 200]
+        assert len(started) == 2
+
+    @pytest.mark.asyncio
+    async def test_full_queue_is_shed(self):
+        """Test requests finding the queue full get 429 with Retry-After."""
+        release, started = asyncio.Event(), []
+        middleware = make_middleware(make_app(release, started))
+
+        async with AsyncClient(app=middleware, base_url="http://test") as client:
+            running = [asyncio.create_task(client.get(EXPORT_PATH)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            response = await client.get(EXPORT_PATH)
+            release.set()
+            await asyncio.gather(*running)
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+        assert response.json()["error"]["type"] == "OVERLOADED"
+        assert response.json()["error"]["details"] == {"priority": "batch"}
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_is_shed(self):
+        """Test requests waiting longer than the queue timeout get 503."""
+        release, started = asyncio.Event(), []
+        middleware = make_middleware(make_app(release, started), queue_timeout=0.05)
+
+        async with AsyncClient(app=middleware, base_url="http://test") as client:
+            running = asyncio.create_task(client.get(INFO_PATH))
+            await asyncio.sleep(0.01)
+            response = await client.get(INFO_PATH)
+            release.set()
+            await running
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert started == [INFO_PATH]
+
+        # The abandoned queue place must not leak a slot
+        started.clear()
+        async with AsyncClient(app=middleware, base_url="http://test") as client:
+            response = await client.get(INFO_PATH)
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_is_bounded_by_deadline(self):
+        """Test the queue wait does not outlast the request deadline."""
+        release, started = asyncio.Event(), []
+        middleware = make_middleware(make_app(release, started), queue_timeout=10)
+
+        async with AsyncClient(app=middleware, base_url="http://test") as client:
+            running = asyncio.create_task(client.get(INFO_PATH))
+            await asyncio.sleep(0.01)
+            token = deadline._deadline.set(deadline.time.monotonic() + 0.05)
+            try:
+                response = await asyncio.wait_for(client.get(INFO_PATH), 1)
+            finally:
+                deadline._deadline.reset(token)
+            release.set()
+            await running
+
+        assert response.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_priority_header_downgrades_only(self):
+        """Test X-Priority moves requests to less important classes only."""
+        release, started = asyncio.Event(), []
+        middleware = make_middleware(make_app(release, started))
+
+        async with AsyncClient(app=middleware, base_url="http://test") as client:
+            # Fill the batch lane and its queue with downgraded interactive calls
+            running = [
+                asyncio.create_task(client.get(INFO_PATH, headers={"X-Priority": "batch"}))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.05)
+            shed = await client.get(INFO_PATH, headers={"X-Priority": "batch"})
+            # Asking for a more important class keeps the route's class
+            upgraded = asyncio.create_task(client.get(EXPORT_PATH, headers={"X-Priority": "interactive"}))
+            await asyncio.sleep(0.05)
+            interactive = asyncio.create_task(client.get(INFO_PATH))
+            await asyncio.sleep(0.05)
+            assert started == [INFO_PATH, INFO_PATH]
+            release.set()
+            await asyncio.gather(*running, interactive)
+            upgraded_response = await upgraded
+
+        assert shed.status_code == 429
+        assert upgraded_response.status_code == 429
+        assert interactive.result().status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_unmanaged_route_passes_through(self):
+        """Test routes without a priority class are not limited."""
+        release, started = asyncio.Event(), []
+        release.set()
+        middleware = AdmissionControlMiddleware(make_app(release, started), priority_classes=[
+            PriorityClass(name="interactive", rank=0, max_concurrency=0, max_queue=0, queue_timeout=0),
+        ])
+
+        async with AsyncClient(app=middleware, base_url="http://test") as client:
+            response = await client.get("/health/live")
+
+        assert response.status_code == 200
+
+
+class TestDatabaseBudget:
+    """Unit tests for check_database_budget."""
+
+    def test_default_budgets_fit_pool(self, monkeypatch):
+        """Test the default listing and batch budgets leave connections for interactive requests."""
+        monkeypatch.setattr(settings, "database_url", "postgresql://localhost/tron")
+
+        assert check_database_budget(get_priority_classes())
+
+    def test_budgets_exceeding_pool(self, monkeypatch):
+        """Test budgets that can take the whole pool are reported."""
+        monkeypatch.setattr(settings, "database_url", "postgresql://localhost/tron")
+        monkeypatch.setattr(settings, "database_pool_size", 5)
+        monkeypatch.setattr(settings, "database_max_overflow", 10)
+        priority_classes = [
+            PriorityClass(name="interactive", rank=0, max_concurrency=64, max_queue=1, queue_timeout=1),
+            PriorityClass(name="listing", rank=1, max_concurrency=16, max_queue=1, queue_timeout=1),
+            PriorityClass(name="batch", rank=2, max_concurrency=2, max_queue=1, queue_timeout=1),
+        ]
+
+        assert not check_database_budget(priority_classes)
@@ -0,0 +1,100 @@
+"""Unit tests for cache backends."""
+
+import sqlite3
+
+import pytest
+from unittest.mock import Mock
+
+from app.core.cache import CacheBackend, MemoryCacheBackend, SharedMemoryCacheBackend
+from app.services.tron_service import TronService
+from app.services.wallet_cache import WalletSnapshotStore
+
+ADDRESS = "TTestAddress123456789012345678901234567890"
+
+
+class TestCacheBackend:
+    """Unit tests for the CacheBackend interface."""
+
+    def test_incomplete_backend_cannot_be_created(self):
+        """Test backends missing get or set fail when instantiated."""
+        class ReadOnlyBackend(CacheBackend):
+            async def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            ReadOnlyBackend()
+
+
+class TestMemoryCacheBackend:
+    """Unit tests for MemoryCacheBackend."""
+
+    @pytest.mark.asyncio
+    async def test_get_and_expire(self):
+        """Test values are returned until their TTL passes."""
+        cache = MemoryCacheBackend(max_entries=10)
+        await cache.set("live", b"1", ttl=60)
+        await cache.set("expired", b"2", ttl=-1)
+
+        assert await cache.get("live") == b"1"
+        assert await cache.get("expired") is None
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_oldest(self):
+        """Test the oldest entry is evicted when the cache is full."""
+        cache = MemoryCacheBackend(max_entries=2)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key.encode(), ttl=60)
+
+        assert await cache.get("a") is None
+        assert await cache.get("c") == b"c"
+
+
+class TestSharedMemoryCacheBackend:
+    """Unit tests for SharedMemoryCacheBackend."""
+
+    @pytest.mark.asyncio
+    async def test_shared_between_instances(self, tmp_path):
+        """Test entries written by one worker are visible to another."""
+        path = str(tmp_path / "cache.db")
+        writer = SharedMemoryCacheBackend(path, max_entries=10)
+        reader = SharedMemoryCacheBackend(path, max_entries=10)
+
+        await writer.set("key", b"value", ttl=60)
+        await writer.set("expired", b"value", ttl=-1)
+
+        assert await reader.get("key") == b"value"
+        assert await reader.get("expired") is None
+
+
+    @pytest.mark.asyncio
+    async def test_errors_are_treated_as_miss(self, tmp_path):
+        """Test SQLite errors such as a locked database degrade to cache misses."""
+        cache = SharedMemoryCacheBackend(str(tmp_path / "cache.db"), max_entries=10)
+        await cache.set("key", b"value", ttl=60)
+        cache._get = Mock(side_effect=sqlite3.OperationalError("database is locked"))
+        cache._set = Mock(side_effect=sqlite3.OperationalError("database or disk is full"))
+
+        assert await cache.get("key") is None
+        await cache.set("other", b"value", ttl=60)
+
+
+class TestTronServiceCache:
+    """Unit tests for wallet info caching in TronService."""
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_is_cached(self):
+        """Test a cached wallet is not fetched from the network again."""
+        service = TronService()
+        service._cache = WalletSnapshotStore(max_entries=10, ttl=60)
+        service._client = Mock()
+        service._client.is_address.return_value = True
+        service._client.get_account.return_value = {"balance": 2_500_000}
+        service._client.get_account_resource.return_value = {"freeNetLimit": 600, "EnergyLimit": 100}
+
+        first = await service.get_wallet_info(ADDRESS)
+        second = await service.get_wallet_info(ADDRESS)
+
+        assert first == second
+        assert second.balance == 2.5
+        assert service._client.get_account.call_count == 1
@@ -0,0 +1,164 @@
+"""Unit tests for request deadlines and disconnect cancellation."""
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from unittest.mock import AsyncMock, Mock
+
+from app.core import deadline
+from app.core.deadline import DeadlineMiddleware, check_deadline, get_remaining, with_deadline
+from app.core.exceptions import DeadlineExceededException
+from app.core.cache import MemoryCacheBackend
+from app.db.database import get_db
+from app.main import app
+from app.services.tron_service import TronService, get_tron_service
+from app.services.wallet_cache import NegativeWalletCache
+from app.services.wallet_service import WalletService
+
+ADDRESS = "TTestAddress123456789012345678901234567890"
+
+
+class TestDeadline:
+    """Unit tests for deadline helpers."""
+
+    @pytest.mark.asyncio
+    async def test_without_deadline(self):
+        """Test work is not limited when no deadline is set."""
+        assert get_remaining() is None
+        assert await with_deadline(asyncio.sleep(0, result=1)) == 1
+        check_deadline()
+
+    @pytest.mark.asyncio
+    async def test_with_deadline_cancels_work(self):
+        """Test work running past the deadline is cancelled."""
+        token = deadline._deadline.set(deadline.time.monotonic() + 0.05)
+        try:
+            with pytest.raises(DeadlineExceededException):
+                await with_deadline(asyncio.sleep(10))
+            with pytest.raises(DeadlineExceededException):
+                check_deadline()
+        finally:
+            deadline._deadline.reset(token)
+
+    @pytest.mark.asyncio
+    async def test_expired_request_is_not_saved(self):
+        """Test the audit row is skipped when the deadline passes during the lookup."""
+        service = WalletService(Mock(spec=TronService))
+        service.negative_cache = NegativeWalletCache(MemoryCacheBackend(max_entries=10), ttl=60)
+        service._save_wallet_request = AsyncMock()
+
+        async def slow_lookup(address, tokens):
+            await asyncio.sleep(0.1)
+
+        service.tron_service.get_wallet_info = slow_lookup
+        token = deadline._deadline.set(deadline.time.monotonic() + 0.05)
+        try:
+            with pytest.raises(DeadlineExceededException):
+                await service.get_wallet_info_and_save(ADDRESS, db=Mock())
+        finally:
+            deadline._deadline.reset(token)
+
+        service._save_wallet_request.assert_not_called()
+
+
+class TestDeadlineMiddleware:
+    """Unit tests for DeadlineMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_deadline_from_header(self):
+        """Test the deadline is taken from the X-Request-Timeout header."""
+        seen = {}
+
+        async def inner(scope, receive, send):
+            seen["remaining"] = get_remaining()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        async with AsyncClient(app=DeadlineMiddleware(inner), base_url="http://test") as client:
+            await client.get("/", headers={"X-Request-Timeout": "2.5"})
+
+        assert 2 < seen["remaining"] <= 2.5
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_request(self):
+        """Test the application is cancelled when the client disconnects."""
+        cancelled = asyncio.Event()
+
+        async def inner(scope, receive, send):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        messages = [
+            {"type": "http.request", "body": b"", "more_body": False},
+            {"type": "http.disconnect"},
+        ]
+
+        async def receive():
+            if len(messages) == 1:
+                await asyncio.sleep(0.05)
+            return messages.pop(0)
+
+        scope = {"type": "http", "headers": []}
+        await asyncio.wait_for(DeadlineMiddleware(inner)(scope, receive, AsyncMock()), timeout=1)
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_after_response_does_not_cancel(self):
+        """Test post-response work survives the disconnect sent once the body is out."""
+        teardown_done = asyncio.Event()
+        response_sent = asyncio.Event()
+
+        async def inner(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+            # Like dependency teardown or background tasks after the response
+            await asyncio.sleep(0.05)
+            teardown_done.set()
+
+        async def send(message):
+            if message["type"] == "http.response.body":
+                response_sent.set()
+
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            # Servers such as uvicorn report a disconnect once the response is complete
+            await response_sent.wait()
+            return {"type": "http.disconnect"}
+
+        scope = {"type": "http", "headers": []}
+        await asyncio.wait_for(DeadlineMiddleware(inner)(scope, receive, send), timeout=1)
+
+        assert teardown_done.is_set()
+
+    @pytest.mark.asyncio
+    async def test_deadline_exceeded_status(self):
+        """Test a lookup running past the requested deadline returns 504."""
+        tron_service = Mock(spec=TronService)
+
+        async def slow_lookup(address, tokens):
+            await with_deadline(asyncio.sleep(10))
+
+        tron_service.get_wallet_info = slow_lookup
+        overrides = app.dependency_overrides.copy()
+        app.dependency_overrides[get_tron_service] = lambda: tron_service
+        app.dependency_overrides[get_db] = lambda: Mock()
+        try:
+            async with AsyncClient(app=app, base_url="http://test") as client:
+                response = await client.post(
+                    "/api/v1/wallet/info",
+                    json={"address": ADDRESS},
+                    headers={"X-Request-Timeout": "0.05"}
+                )
+        finally:
+            app.dependency_overrides = overrides
+
+        assert response.status_code == 504
+        assert response.json()["error"]["type"] == "DEADLINEEXCEEDED"
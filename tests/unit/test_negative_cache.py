@@ -0,0 +1,117 @@
+"""Unit tests for negative caching of invalid and unactivated addresses."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.core.cache import MemoryCacheBackend
+from app.core.exceptions import InvalidAddressException, InvalidTokenException, WalletNotFoundException
+from app.schemas.wallet import WalletInfoResponse
+from app.services.tron_service import TronService
+from app.services.wallet_cache import NegativeWalletCache
+from app.services.wallet_service import WalletService
+
+ADDRESS = "TTestAddress123456789012345678901234567890"
+USDT = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+
+@pytest.fixture
+def wallet_service():
+    """Create wallet service with mocked TRON service, database writes and fresh caches."""
+    service = WalletService(Mock(spec=TronService))
+    service.tron_service.get_wallet_info = AsyncMock()
+    service.negative_cache = NegativeWalletCache(MemoryCacheBackend(max_entries=10), ttl=60)
+    service._save_wallet_request = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def unactivated_tron_service(tron_service):
+    """Create TRON service whose client reports the account as not activated."""
+    from tronpy.exceptions import AddressNotFound
+
+    tron_service._client.get_account.side_effect = AddressNotFound("account not found on-chain")
+    return tron_service
+
+
+class TestNegativeCache:
+    """Unit tests for negative caching in WalletService.get_wallet_info_and_save."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_address_fails_fast(self, wallet_service):
+        """Test repeated invalid addresses skip upstream calls and audit rows."""
+        wallet_service.tron_service.get_wallet_info.side_effect = InvalidAddressException("Invalid TRON address")
+
+        for _ in range(3):
+            with pytest.raises(InvalidAddressException):
+                await wallet_service.get_wallet_info_and_save(ADDRESS, db=Mock())
+
+        assert wallet_service.tron_service.get_wallet_info.call_count == 1
+        assert wallet_service._save_wallet_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unactivated_account_gets_zero_balance(self, wallet_service):
+        """Test accounts missing on-chain return a zero balance instead of an error."""
+        wallet_service.tron_service.get_wallet_info.side_effect = WalletNotFoundException("Account not activated")
+
+        first = await wallet_service.get_wallet_info_and_save(ADDRESS, db=Mock())
+        second = await wallet_service.get_wallet_info_and_save(ADDRESS, db=Mock())
+
+        assert first == second
+        assert first.balance == 0.0
+        assert first.activated is False
+        assert wallet_service.tron_service.get_wallet_info.call_count == 1
+        assert wallet_service._save_wallet_request.call_count == 1
+        assert wallet_service._save_wallet_request.call_args.kwargs["error_message"] is None
+
+    @pytest.mark.asyncio
+    async def test_network_errors_are_not_cached(self, wallet_service):
+        """Test transient failures are retried on the next request."""
+        wallet_service.tron_service.get_wallet_info.side_effect = Exception("timeout")
+
+        for _ in range(2):
+            with pytest.raises(Exception):
+                await wallet_service.get_wallet_info_and_save(ADDRESS, db=Mock())
+
+        assert wallet_service.tron_service.get_wallet_info.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_does_not_cache_address(self, wallet_service):
+        """Test a bad token contract does not mark the wallet address as invalid."""
+        wallet_service.tron_service.get_wallet_info.side_effect = [
+            InvalidTokenException("Invalid TRC-20 contract address: bogus-token"),
+            WalletInfoResponse(address=ADDRESS, balance=1.0),
+        ]
+
+        with pytest.raises(InvalidTokenException):
+            await wallet_service.get_wallet_info_and_save(ADDRESS, db=Mock(), tokens=["bogus-token"])
+        result = await wallet_service.get_wallet_info_and_save(ADDRESS, db=Mock())
+
+        assert result.balance == 1.0
+        assert await wallet_service.negative_cache.get(ADDRESS) is None
+
+    @pytest.mark.asyncio
+    async def test_unactivated_account_keeps_token_balances(self, unactivated_tron_service):
+        """Test requested token balances are returned for unactivated accounts, cached or not."""
+        wallet_service = WalletService(unactivated_tron_service)
+        wallet_service.negative_cache = NegativeWalletCache(MemoryCacheBackend(max_entries=10), ttl=60)
+        wallet_service._save_wallet_request = AsyncMock()
+
+        first = await wallet_service.get_wallet_info_and_save(ADDRESS, db=Mock(), tokens=[USDT])
+        second = await wallet_service.get_wallet_info_and_save(ADDRESS, db=Mock(), tokens=[USDT])
+        plain = await wallet_service.get_wallet_info_and_save(ADDRESS, db=Mock())
+
+        assert first == second
+        assert first.activated is False
+        assert [token.raw_balance for token in first.tokens] == [12_345_678]
+        assert plain.tokens is None
+        assert unactivated_tron_service._client.get_account.call_count == 1
+
+
+class TestTronServiceAccountNotFound:
+    """Unit tests for mapping missing accounts in TronService."""
+
+    @pytest.mark.asyncio
+    async def test_missing_account_raises_not_found(self, unactivated_tron_service):
+        """Test unactivated accounts raise WalletNotFoundException instead of a network error."""
+        with pytest.raises(WalletNotFoundException):
+            await unactivated_tron_service.get_wallet_info(ADDRESS)
@@ -0,0 +1,57 @@
+"""Unit tests for JSON response classes."""
+
+import json
+
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.responses import ModelJSONResponse, model_response
+from app.schemas.wallet import WalletInfoResponse
+
+
+class TestModelJSONResponse:
+    """Unit tests for ModelJSONResponse rendering."""
+
+    def test_renders_model_directly(self):
+        """Test Pydantic models are rendered with model_dump_json."""
+        wallet_info = WalletInfoResponse(
+            address="TTestAddress123456789012345678901234567890",
+            balance=100.5,
+            bandwidth=1000.0,
+            energy=None
+        )
+
+        response = ModelJSONResponse(wallet_info)
+
+        assert response.body == wallet_info.model_dump_json().encode()
+        assert response.media_type == "application/json"
+
+    def test_renders_plain_content(self):
+        """Test non-model content is still rendered as JSON."""
+        response = ModelJSONResponse({"status": "healthy", "count": 1})
+
+        assert json.loads(response.body) == {"status": "healthy", "count": 1}
+
+
+class TestModelResponse:
+    """Unit tests for model_response."""
+
+    def test_fast_json_enabled(self, monkeypatch):
+        """Test models are rendered by pydantic-core when FAST_JSON is on."""
+        monkeypatch.setattr(settings, "fast_json", True)
+        wallet_info = WalletInfoResponse(address="TTestAddress123456789012345678901234567890", balance=1.5)
+
+        response = model_response(wallet_info)
+
+        assert isinstance(response, ModelJSONResponse)
+        assert response.body == wallet_info.model_dump_json().encode()
+
+    def test_fast_json_disabled(self, monkeypatch):
+        """Test models go through the standard JSON encoder when FAST_JSON is off."""
+        monkeypatch.setattr(settings, "fast_json", False)
+        wallet_info = WalletInfoResponse(address="TTestAddress123456789012345678901234567890", balance=1.5)
+
+        response = model_response(wallet_info)
+
+        assert type(response) is JSONResponse
+        assert json.loads(response.body) == wallet_info.model_dump(mode="json")
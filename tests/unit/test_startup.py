@@ -0,0 +1,53 @@
+"""Unit tests for startup behaviour and health endpoints."""
+
+import subprocess
+import sys
+
+import pytest
+from httpx import AsyncClient
+from unittest.mock import patch
+
+from app.main import app
+from app.services import tron_service as tron_service_module
+
+
+class TestStartup:
+    """Unit tests for lazy initialization and health checks."""
+
+    def test_tronpy_is_imported_lazily(self):
+        """Test importing the application does not import tronpy."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, app.main; print('tronpy' in sys.modules)"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_tron_service_is_shared(self):
+        """Test the TronService dependency returns one instance per process."""
+        assert tron_service_module.get_tron_service() is tron_service_module.get_tron_service()
+        assert tron_service_module.is_tron_service_ready()
+
+    @pytest.mark.asyncio
+    async def test_liveness(self):
+        """Test liveness does not depend on the TRON client or database."""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.get("/health/live")
+
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_readiness_waits_for_tron_client(self):
+        """Test readiness fails until the TRON client has been created."""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            with patch.object(tron_service_module, "_tron_service", None):
+                not_ready = await client.get("/health/ready")
+            tron_service_module.get_tron_service()
+            with patch("app.main.check_db", return_value=True):
+                ready = await client.get("/health/ready")
+
+        assert not_ready.status_code == 503
+        assert not_ready.json()["checks"]["tron_client"] is False
+        assert ready.status_code == 200
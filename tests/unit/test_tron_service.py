@@ -0,0 +1,91 @@
+"""Unit tests for TRON service token balance lookups."""
+
+import pytest
+from decimal import Decimal
+
+from app.core.config import settings
+from app.core.exceptions import InvalidTokenException
+from app.services import tron_service as tron_service_module
+
+ADDRESS = "TTestAddress123456789012345678901234567890"
+USDT = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+
+class TestTronServiceTokens:
+    """Unit tests for TRC-20 balances in TronService.get_wallet_info."""
+
+    @pytest.mark.asyncio
+    async def test_without_tokens(self, tron_service):
+        """Test tokens are omitted when not requested."""
+        result = await tron_service.get_wallet_info(ADDRESS)
+
+        assert result.balance == 1.0
+        assert result.tokens is None
+        tron_service._client.get_contract.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_token_balances(self, tron_service):
+        """Test token balances are scaled by decimals and added to the response."""
+        result = await tron_service.get_wallet_info(ADDRESS, [USDT])
+
+        assert len(result.tokens) == 1
+        token = result.tokens[0]
+        assert token.contract_address == USDT
+        assert token.symbol == "USDT"
+        assert token.decimals == 6
+        assert token.raw_balance == 12_345_678
+        assert token.balance == Decimal("12.345678")
+
+    @pytest.mark.asyncio
+    async def test_token_balance_is_exact(self, tron_service):
+        """Test 18-decimal balances keep every digit."""
+        raw_balance = 123_456_789_012_345_678_901_234_567
+        contract = tron_service._client.get_contract.return_value
+        contract.functions.decimals.return_value = 18
+        contract.functions.balanceOf.return_value = raw_balance
+
+        result = await tron_service.get_wallet_info(ADDRESS, [USDT])
+
+        token = result.tokens[0]
+        assert token.raw_balance == raw_balance
+        assert token.balance == Decimal("123456789.012345678901234567")
+        assert '"balance":"123456789.012345678901234567"' in result.model_dump_json()
+
+    @pytest.mark.asyncio
+    async def test_contract_metadata_is_cached(self, tron_service):
+        """Test contract ABI and metadata are loaded once per process."""
+        await tron_service.get_wallet_info(ADDRESS, [USDT])
+        await tron_service.get_wallet_info(ADDRESS, [USDT])
+
+        contract = tron_service._client.get_contract.return_value
+        assert tron_service._client.get_contract.call_count == 1
+        assert contract.functions.decimals.call_count == 1
+        assert contract.functions.balanceOf.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_contract_cache_is_bounded(self, tron_service, monkeypatch):
+        """Test the least recently used contract is evicted when the cache is full."""
+        monkeypatch.setattr(settings, "token_contract_cache_max_entries", 2)
+
+        for token in ("TTokenA", "TTokenB", "TTokenA", "TTokenC"):
+            await tron_service.get_wallet_info(ADDRESS, [token])
+
+        cached = [token for _, token in tron_service_module._token_contracts]
+        assert cached == ["TTokenA", "TTokenC"]
+        assert tron_service._client.get_contract.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_address(self, tron_service):
+        """Test invalid contract addresses are rejected."""
+        with pytest.raises(InvalidTokenException):
+            await tron_service.get_wallet_info(ADDRESS, ["invalid"])
+
+    @pytest.mark.asyncio
+    async def test_non_contract_token_address(self, tron_service):
+        """Test addresses without a TRC-20 ABI, such as wallets, are rejected as invalid tokens."""
+        from tronpy.contract import Contract
+
+        tron_service._client.get_contract.return_value = Contract(addr=USDT, abi=[])
+
+        with pytest.raises(InvalidTokenException):
+            await tron_service.get_wallet_info(ADDRESS, [USDT])
@@ -0,0 +1,71 @@
+"""Unit tests for wallet snapshot caches."""
+
+import pytest
+
+from app.core.cache import MemoryCacheBackend
+from app.schemas.wallet import WalletInfoResponse
+from app.services.wallet_cache import BackendWalletCache, WalletSnapshotStore
+
+ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+OTHER_ADDRESS = "TLa2f6VPqDgRE67v1736s7bJ8Ray5wYjU7"
+
+
+def make_info(address, balance=12.345678, bandwidth=600.0, energy=None):
+    """Create wallet info."""
+    return WalletInfoResponse(address=address, balance=balance, bandwidth=bandwidth, energy=energy)
+
+
+class TestWalletSnapshotStore:
+    """Unit tests for WalletSnapshotStore."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        """Test snapshots are returned with the same values."""
+        store = WalletSnapshotStore(max_entries=10, ttl=60)
+        await store.set(ADDRESS, make_info(ADDRESS))
+
+        assert await store.get(ADDRESS) == make_info(ADDRESS)
+        assert await store.get(OTHER_ADDRESS) is None
+
+    @pytest.mark.asyncio
+    async def test_expired_slot_is_reused(self):
+        """Test expired snapshots are dropped and their slot reused."""
+        store = WalletSnapshotStore(max_entries=10, ttl=-1)
+        await store.set(ADDRESS, make_info(ADDRESS))
+
+        assert await store.get(ADDRESS) is None
+        assert len(store) == 0
+
+        await store.set(OTHER_ADDRESS, make_info(OTHER_ADDRESS))
+        assert len(store._balance) == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_oldest(self):
+        """Test the oldest snapshot is evicted when the store is full."""
+        store = WalletSnapshotStore(max_entries=1, ttl=60)
+        await store.set(ADDRESS, make_info(ADDRESS))
+        await store.set(OTHER_ADDRESS, make_info(OTHER_ADDRESS, balance=None))
+
+        assert await store.get(ADDRESS) is None
+        assert (await store.get(OTHER_ADDRESS)).balance is None
+        assert len(store._balance) == 1
+
+    @pytest.mark.asyncio
+    async def test_addresses_are_stored_decoded(self):
+        """Test base58 addresses are keyed by their 21 raw bytes."""
+        store = WalletSnapshotStore(max_entries=10, ttl=60)
+        await store.set(ADDRESS, make_info(ADDRESS))
+
+        assert [len(key) for key in store._slots] == [21]
+
+
+class TestBackendWalletCache:
+    """Unit tests for BackendWalletCache."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        """Test snapshots are stored as JSON in the backend."""
+        cache = BackendWalletCache(MemoryCacheBackend(max_entries=10), ttl=60)
+        await cache.set(ADDRESS, make_info(ADDRESS))
+
+        assert await cache.get(ADDRESS) == make_info(ADDRESS)
@@ -0,0 +1,88 @@
+"""Unit tests for streaming export of wallet requests."""
+
+import csv
+import io
+
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+
+from app.core.exceptions import ValidationException
+from app.models.wallet_request import WalletRequest
+from app.services.export_service import EXPORT_COLUMNS, get_exporter, iter_csv, iter_parquet
+
+START = datetime(2026, 1, 1)
+
+
+@pytest_asyncio.fixture
+async def async_db(async_db):
+    """Add sample requests to the in-memory session."""
+    for i in range(25):
+        async_db.add(WalletRequest(
+            address=f"TTestAddress{i % 2:036d}",
+            balance=float(i),
+            bandwidth=1000.0,
+            energy=500.0,
+            request_timestamp=START + timedelta(minutes=i),
+            response_data="{}",
+        ))
+    await async_db.commit()
+    return async_db
+
+
+class TestWalletExport:
+    """Unit tests for WalletService.stream_wallet_requests and exporters."""
+
+    @pytest.mark.asyncio
+    async def test_stream_in_chunks(self, wallet_service, async_db):
+        """Test requests are streamed in bounded batches of tuples."""
+        batches = [
+            batch async for batch in wallet_service.stream_wallet_requests(async_db, chunk_size=10)
+        ]
+
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert len(batches[0][0]) == len(EXPORT_COLUMNS)
+        assert [row[0] for batch in batches for row in batch] == list(range(1, 26))
+
+    @pytest.mark.asyncio
+    async def test_stream_with_filters(self, wallet_service, async_db):
+        """Test address and time filters are applied."""
+        batches = wallet_service.stream_wallet_requests(
+            async_db,
+            address=f"TTestAddress{0:036d}",
+            start=START + timedelta(minutes=4),
+            end=START + timedelta(minutes=10)
+        )
+        rows = [row async for batch in batches for row in batch]
+
+        assert [row[2] for row in rows] == [4.0, 6.0, 8.0]
+
+    @pytest.mark.asyncio
+    async def test_csv_export(self, wallet_service, async_db):
+        """Test CSV export contains a header and every row."""
+        chunks = [
+            chunk async for chunk in iter_csv(wallet_service.stream_wallet_requests(async_db, chunk_size=10))
+        ]
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+
+        assert len(chunks) == 3
+        assert tuple(rows[0]) == EXPORT_COLUMNS
+        assert len(rows) == 26
+        assert rows[1][5] == START.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_parquet_export(self, wallet_service, async_db):
+        """Test Parquet export round-trips every row."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        chunks = [
+            chunk async for chunk in iter_parquet(wallet_service.stream_wallet_requests(async_db, chunk_size=10))
+        ]
+        table = pq.read_table(io.BytesIO(b"".join(chunks)))
+
+        assert table.num_rows == 25
+        assert tuple(table.column_names) == EXPORT_COLUMNS
+
+    def test_unsupported_format(self):
+        """Test unknown export formats are rejected."""
+        with pytest.raises(ValidationException):
+            get_exporter("xlsx")
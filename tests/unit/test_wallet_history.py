@@ -0,0 +1,88 @@
+"""Unit tests for downsampled wallet history queries."""
+
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import ValidationException
+from app.models.wallet_request import WalletRequest
+from app.services.wallet_service import _epoch_seconds
+
+ADDRESS = "TTestAddress123456789012345678901234567890"
+START = datetime(2026, 1, 1)
+
+
+async def _add_requests(db, rows):
+    """Insert wallet request rows of (minutes offset, balance, error)."""
+    for minutes, balance, error in rows:
+        db.add(WalletRequest(
+            address=ADDRESS,
+            balance=balance,
+            bandwidth=balance * 10 if balance is not None else None,
+            energy=0.0 if balance is not None else None,
+            request_timestamp=START + timedelta(minutes=minutes),
+            error_message=error
+        ))
+    await db.commit()
+
+
+class TestWalletHistory:
+    """Unit tests for WalletService.get_wallet_history."""
+
+    @pytest.mark.asyncio
+    async def test_history_is_bucketed(self, wallet_service, async_db):
+        """Test requests are aggregated into hourly buckets."""
+        await _add_requests(async_db, [
+            (0, 10.0, None),
+            (20, 30.0, None),
+            (40, 20.0, None),
+            (50, None, "TRON network error"),
+            (130, 5.0, None),
+        ])
+
+        result = await wallet_service.get_wallet_history(
+            async_db, ADDRESS, START, START + timedelta(hours=3), 3600
+        )
+
+        assert [point.bucket_start for point in result.points] == [START, START + timedelta(hours=2)]
+        first = result.points[0]
+        assert first.samples == 3
+        assert first.balance.min == 10.0
+        assert first.balance.max == 30.0
+        assert first.balance.avg == pytest.approx(20.0)
+        assert first.balance.last == 20.0
+        assert first.bandwidth.last == 200.0
+        assert result.points[1].samples == 1
+        assert result.points[1].balance.last == 5.0
+
+    @pytest.mark.asyncio
+    async def test_history_respects_range(self, wallet_service, async_db):
+        """Test requests outside the range and of other addresses are ignored."""
+        await _add_requests(async_db, [(0, 10.0, None), (200, 30.0, None)])
+
+        result = await wallet_service.get_wallet_history(
+            async_db, ADDRESS, START + timedelta(hours=1), START + timedelta(hours=2), 60
+        )
+        assert result.points == []
+
+        other = await wallet_service.get_wallet_history(
+            async_db, "TOther", START, START + timedelta(hours=4), 3600
+        )
+        assert other.points == []
+
+    @pytest.mark.asyncio
+    async def test_history_rejects_invalid_range(self, wallet_service, async_db):
+        """Test empty ranges and too many points are rejected."""
+        with pytest.raises(ValidationException):
+            await wallet_service.get_wallet_history(async_db, ADDRESS, START, START, 60)
+
+        with pytest.raises(ValidationException):
+            await wallet_service.get_wallet_history(
+                async_db, ADDRESS, START, START + timedelta(days=365), 60
+            )
+
+    def test_epoch_seconds_truncates_on_postgresql(self):
+        """Test fractional seconds are floored, not rounded, outside SQLite."""
+        expression = _epoch_seconds(WalletRequest.request_timestamp, "postgresql")
+        sql = str(expression.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("CAST(floor(EXTRACT(epoch FROM")
@@ -0,0 +1,48 @@
+"""Unit tests for the paginated wallet requests query."""
+
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.wallet_request import WalletRequest
+
+
+@pytest_asyncio.fixture
+async def async_engine(async_engine):
+    """Add sample requests to the in-memory engine."""
+    async with async_sessionmaker(async_engine, expire_on_commit=False)() as session:
+        for i in range(15):
+            session.add(WalletRequest(
+                address=f"TTestAddress{i:030d}",
+                balance=float(i),
+                bandwidth=1000.0,
+                energy=500.0,
+                request_timestamp=datetime(2026, 1, 1) + timedelta(minutes=i),
+                response_data="x" * 1024,
+            ))
+        await session.commit()
+    return async_engine
+
+
+class TestWalletRequestsQuery:
+    """Unit tests for WalletService.get_wallet_requests."""
+
+    @pytest.mark.asyncio
+    async def test_selects_only_record_columns(self, wallet_service, async_engine):
+        """Test the page query does not load response_data."""
+        statements = []
+        event.listen(
+            async_engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement)
+        )
+
+        async with AsyncSession(async_engine) as db:
+            result = await wallet_service.get_wallet_requests(db, page=1, page_size=10)
+
+        assert result.total == 15
+        assert result.total_pages == 2
+        assert [record.balance for record in result.records] == [float(i) for i in range(14, 4, -1)]
+        assert all("response_data" not in statement for statement in statements)
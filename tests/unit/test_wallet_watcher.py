@@ -0,0 +1,93 @@
+"""Unit tests for the shared wallet watcher."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.core.exceptions import WalletNotFoundException
+from app.schemas.wallet import WalletInfoResponse
+from app.services.tron_service import TronService
+from app.services.wallet_watcher import WalletWatcher, iter_events
+
+ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+OTHER_ADDRESS = "TLa2f6VPqDgRE67v1736s7bJ8Ray5wYjU7"
+
+
+def make_info(address, balance=1.0):
+    """Create wallet info."""
+    return WalletInfoResponse(address=address, balance=balance, bandwidth=600.0, energy=0.0)
+
+
+@pytest.fixture
+def watcher():
+    """Create watcher with a mocked TRON service and a long interval."""
+    tron_service = Mock(spec=TronService)
+    tron_service.get_wallet_info = AsyncMock(side_effect=lambda address: make_info(address))
+    return WalletWatcher(tron_service, interval=3600, max_concurrency=4)
+
+
+class TestWalletWatcher:
+    """Unit tests for WalletWatcher polling and fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_address_is_polled_once_for_all_subscribers(self, watcher):
+        """Test subscribers of the same address share one upstream call."""
+        first = watcher.subscribe([ADDRESS])
+        second = watcher.subscribe([ADDRESS, OTHER_ADDRESS])
+
+        first_changes = await first.next_changes(timeout=1)
+        second_changes = await second.next_changes(timeout=1)
+
+        assert watcher.tron_service.get_wallet_info.call_count == 2
+        assert first_changes == {ADDRESS: {"balance": 1.0, "bandwidth": 600.0, "energy": 0.0, "activated": True}}
+        assert set(second_changes) == {ADDRESS, OTHER_ADDRESS}
+        watcher.unsubscribe(first)
+        watcher.unsubscribe(second)
+
+    @pytest.mark.asyncio
+    async def test_only_changes_are_pushed(self, watcher):
+        """Test later polls push changed fields only, and nothing when unchanged."""
+        subscription = watcher.subscribe([ADDRESS])
+        await subscription.next_changes(timeout=1)
+
+        await watcher.poll()
+        assert await subscription.next_changes(timeout=0.01) == {}
+
+        watcher.tron_service.get_wallet_info.side_effect = lambda address: make_info(address, balance=2.5)
+        await watcher.poll()
+        await watcher.poll()
+        assert await subscription.next_changes(timeout=0.01) == {ADDRESS: {"balance": 2.5}}
+        watcher.unsubscribe(subscription)
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_gets_current_state(self, watcher):
+        """Test a new subscriber immediately receives the known state."""
+        first = watcher.subscribe([ADDRESS])
+        await first.next_changes(timeout=1)
+
+        late = watcher.subscribe([ADDRESS])
+        assert (await late.next_changes(timeout=0.01))[ADDRESS]["balance"] == 1.0
+        watcher.unsubscribe(first)
+        watcher.unsubscribe(late)
+
+    @pytest.mark.asyncio
+    async def test_unactivated_account(self, watcher):
+        """Test unactivated accounts are reported with a zero balance."""
+        watcher.tron_service.get_wallet_info.side_effect = WalletNotFoundException("Account not activated")
+        subscription = watcher.subscribe([ADDRESS])
+
+        changes = await subscription.next_changes(timeout=1)
+
+        assert changes[ADDRESS]["activated"] is False
+        assert changes[ADDRESS]["balance"] == 0.0
+        watcher.unsubscribe(subscription)
+
+    @pytest.mark.asyncio
+    async def test_polling_stops_without_subscribers(self, watcher):
+        """Test closing the last event stream unsubscribes and stops polling."""
+        events = iter_events(watcher, [ADDRESS])
+        event = await events.__anext__()
+        await events.aclose()
+
+        assert event.startswith("event: wallet\n")
+        assert watcher._subscribers == {}
+        assert watcher._task is None